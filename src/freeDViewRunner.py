@@ -4,19 +4,25 @@ Phase 2: FreeDView Runner
 This module renders the sets in the "testSets" directory and creates
 new sequential images using the FreeDView renderer.
 """
-import re
 import os
 import logging
 import json
+import uuid
 import shutil
+import tempfile
 import subprocess
-from pathlib import Path
-from typing import List, Tuple, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
+import itertools
+from contextlib import nullcontext
+from typing import List, NamedTuple, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import getDataIni as data_ini
 import jsonLocalizer as json_localizer
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard json module
+    orjson = None
+
 # Constants
 TEST_SETS_DIR = "testSets"
 TEST_SETS_RESULTS_DIR = "testSets_results"
@@ -28,29 +34,169 @@ FREEDVIEW_EXE = "freedview.exe"
 STANDALONE_RENDER = "standAloneRender"
 TEST_ME_JSON = "testMe"
 OUTPUT_IMAGE_PREFIX = "wauwStills_F.jpg"
-CLUSTER_SIZE = "12"
+CLUSTER_SIZE = "12"  # Upper bound for the auto-tuned -clusterSize
 VIDEO_EXPORT_CAMERA_NAME = "renderCAM_NEWShape"
-DEFAULT_MAX_WORKERS = 4  # Default number of parallel rendering threads
+DEFAULT_MAX_WORKERS = 4  # Default number of parallel rendering processes
+DELETE_SCRATCH_SUFFIX = ".delete-"  # Suffix for old outputs awaiting deletion
+RENDER_TIMEOUT_SECONDS = 3600  # Kill a FreeDView render that runs longer than this
 
 # Configure module-level logger
 logger = logging.getLogger(__name__)
 
+# Background threads deleting replaced output directories
+_cleanup_pool = ThreadPoolExecutor(max_workers=2)
+
+
+class RenderTask(NamedTuple):
+    """A fully resolved render, as sent to a worker process."""
+    cmd: List[str]  # FreeDView command line
+    fd_path: str  # FreeDView version directory (working directory)
+    output_path: str  # Directory the frames are rendered into
+    freedview_ver_name: str  # FreeDView version name, for logging
+    json_file_path: str  # Source JSON file, for logging
+
+
+def _init_worker(log_level: int) -> None:
+    """
+    Initialize a render worker process.
+
+    Args:
+        log_level: Root logger level of the parent process
+    """
+    logging.getLogger().setLevel(log_level)
+
+
+def _load_json(file_path: str) -> dict:
+    """
+    Load a JSON file, using orjson when it is installed.
+
+    Args:
+        file_path: Path to the JSON file
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    if orjson is not None:
+        with open(file_path, 'rb') as data_file:
+            return orjson.loads(data_file.read())
+    with open(file_path, 'r', encoding='utf-8') as data_file:
+        return json.load(data_file)
+
+
+def _trailing_number(name: str) -> Optional[str]:
+    """
+    Get the last run of digits in a file name without using a regex.
+
+    Args:
+        name: File name to scan (e.g., "wauwStills_F0135.jpg")
+
+    Returns:
+        The digits as a string (e.g., "0135"), or None if the name has no digits
+    """
+    end = len(name)
+    while end > 0 and not name[end - 1].isdigit():
+        end -= 1
+    start = end
+    while start > 0 and name[start - 1].isdigit():
+        start -= 1
+    return name[start:end] if start < end else None
+
+
+def _has_all_frames(output_path: str, sequence_length: List[int]) -> bool:
+    """
+    Check whether an output directory already holds every rendered frame.
+
+    Args:
+        output_path: Render output directory
+        sequence_length: [start_frame, end_frame]
+
+    Returns:
+        True if a renamed "<frame>.jpg" exists for every frame in the range
+    """
+    expected = set(range(sequence_length[0], sequence_length[1] + 1))
+    try:
+        with os.scandir(output_path) as entries:
+            for entry in entries:
+                stem, ext = os.path.splitext(entry.name)
+                if ext == '.jpg' and stem.isdigit():
+                    expected.discard(int(stem))
+    except OSError:
+        return False
+    return not expected
+
 
 class FreeDViewRunner:
     """Handles running FreeDView renderer on test sets."""
 
-    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        cluster_size: Optional[int] = None,
+        force: bool = False
+    ):
         """
         Initialize FreeDViewRunner.
 
+        Each parallel render runs its own multi-threaded freedview.exe, so
+        max_workers * cluster_size should be about os.cpu_count() to avoid
+        oversubscribing the cores.
+
         Args:
-            max_workers: Maximum number of parallel rendering threads (default: 4)
+            max_workers: Maximum number of parallel rendering processes (default: 4)
+            cluster_size: FreeDView -clusterSize per render. If None, derived from
+                the CPU count divided by max_workers, capped at CLUSTER_SIZE.
+            force: Re-render outputs that already contain every frame (default: False)
         """
         self.max_workers = max_workers
-        self._progress_lock = Lock()
-        self._render_count = 0
+        if cluster_size is None:
+            cpu_count = os.cpu_count() or DEFAULT_MAX_WORKERS
+            cluster_size = min(int(CLUSTER_SIZE), max(1, cpu_count // max_workers))
+        self.cluster_size = str(cluster_size)
+        self.force = force
         self._successful_renders = 0
         self._failed_renders = 0
+        self._progress_counter = itertools.count(1)
+        self._executor = None
+
+    def __enter__(self) -> 'FreeDViewRunner':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """
+        Get the worker pool, creating it on first use.
+
+        The pool is kept alive across do_it() calls so repeated invocations
+        do not pay the worker startup cost again. Call close() to release it.
+
+        Returns:
+            The persistent ProcessPoolExecutor
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(logging.getLogger().getEffectiveLevel(),)
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the worker pool, waiting for pending renders to finish."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
 
     def do_it(self, ini_path: str) -> None:
         """
@@ -68,11 +214,15 @@ class FreeDViewRunner:
         event_name_tag = 'eventName'
         set_name_tag = 'setName'
 
-        json_file_path_set_test = data_ini.getDataINI(ini_path, set_test_path_tag)[0]
-        freedview_path = data_ini.getDataINI(ini_path, freedview_path_tag)[0]
-        freedview_ver = data_ini.getDataINI(ini_path, freedview_ver_tag)[0]
-        event_name_set_test = data_ini.getDataINI(ini_path, event_name_tag)[0]
-        set_name_set_test = data_ini.getDataINI(ini_path, set_name_tag)[0]
+        config = data_ini.get_many(ini_path, [
+            set_test_path_tag, freedview_path_tag, freedview_ver_tag,
+            event_name_tag, set_name_tag
+        ])
+        json_file_path_set_test = config[set_test_path_tag][0]
+        freedview_path = config[freedview_path_tag][0]
+        freedview_ver = config[freedview_ver_tag][0]
+        event_name_set_test = config[event_name_tag][0]
+        set_name_set_test = config[set_name_tag][0]
 
         # Validate INI data
         if (json_file_path_set_test == data_ini.ERROR_VALUE or
@@ -86,21 +236,17 @@ class FreeDViewRunner:
 
         # Get JSON file paths from JsonLocalizer without creating folders.
         create_folders = None
-        get_json_info = json_localizer_obj.get_json_files(
+        frame_records = list(json_localizer_obj.get_json_files(
             json_file_path_set_test, event_name_set_test,
             set_name_set_test, create_folders
-        )
-
-        # Extract frame and JSON file lists from JsonLocalizer results.
-        folder_frame_list = get_json_info[1]
-        json_file_list = get_json_info[4]
+        ))
 
-        if not json_file_list:
+        if not frame_records:
             logger.warning("No JSON files found to render")
             return
 
         logger.info(f"FreeDView version: {freedview_ver}")
-        logger.info(f"Processing {len(json_file_list)} JSON file(s)")
+        logger.info(f"Processing {len(frame_records)} JSON file(s)")
 
         # Parse version string to extract original and test version names.
         # Format: "version1_VS_version2"
@@ -118,12 +264,11 @@ class FreeDViewRunner:
             return
 
         # Locate FreeDView version directories in the specified path.
-        freedview_ver_path_list, freedview_ver_name_list = (
-            self._get_freedview_versions(freedview_path, freedview_ver,
-                                        freedview_orig, freedview_test)
+        freedview_versions = self._get_freedview_versions(
+            freedview_path, freedview_ver, freedview_orig, freedview_test
         )
 
-        if not freedview_ver_path_list:
+        if not freedview_versions:
             logger.error(
                 f"No FreeDView versions found in path: {freedview_path}. "
                 f"Expected versions: {freedview_orig}, {freedview_test}"
@@ -131,59 +276,117 @@ class FreeDViewRunner:
             return
 
         logger.info(
-            f"Found {len(freedview_ver_path_list)} FreeDView version(s): "
-            f"{', '.join(freedview_ver_name_list)}"
+            f"Found {len(freedview_versions)} FreeDView version(s): "
+            f"{', '.join(name for _, name in freedview_versions)}"
         )
 
-        # Process each FreeDView version and render all JSON files using parallel threads.
-        total_renders = len(freedview_ver_path_list) * len(json_file_list)
-        self._render_count = 0
+        # Process each FreeDView version and render all JSON files using parallel processes.
         self._successful_renders = 0
         self._failed_renders = 0
 
-        # Create list of all render tasks
+        # Pre-flight: validate inputs and resolve every render to its full command line
+        # here, so worker processes only prepare the output folder and run FreeDView.
+        render_settings = [
+            self._read_render_settings(record.frame_path, record.json_file)
+            for record in frame_records
+        ]
+
         render_tasks = []
-        for i, freedview_ver_path in enumerate(freedview_ver_path_list):
-            for x, json_file_path in enumerate(json_file_list):
-                render_tasks.append({
-                    'version_index': i,
-                    'freedview_ver_path': freedview_ver_path,
-                    'freedview_ver_name': freedview_ver_name_list[i],
-                    'json_index': x,
-                    'json_file_path': json_file_path,
-                    'folder_frame': folder_frame_list[x],
-                    'freedview_ver': freedview_ver,  # Full version string for path building
-                    'total_renders': total_renders  # For progress tracking
-                })
+        seen_output_paths = set()
+        skipped_renders = 0
+        for freedview_ver_path, freedview_ver_name in freedview_versions:
+            freedview_exe = os.path.join(freedview_ver_path, FREEDVIEW_EXE)
+            if not os.path.exists(freedview_exe):
+                logger.error(f"FreeDView executable not found: {freedview_exe}")
+                self._failed_renders += len(frame_records)
+                continue
+
+            for record, settings in zip(frame_records, render_settings):
+                if settings is None:
+                    self._failed_renders += 1
+                    continue
+                output_res, sequence_length = settings
+                json_file_path = record.json_file
+
+                # Output directory structure: testSets_results/.../version_name.
+                replace_path = record.frame_path.replace(
+                    TEST_SETS_DIR, TEST_SETS_RESULTS_DIR
+                )
+                output_path = os.path.join(
+                    replace_path, freedview_ver, freedview_ver_name
+                ).replace('\\', '/')
+
+                # Skip duplicate tasks and outputs left complete by an earlier run.
+                if output_path in seen_output_paths:
+                    continue
+                seen_output_paths.add(output_path)
+                if not self.force and _has_all_frames(output_path, sequence_length):
+                    logger.debug(f"Render cache hit, skipping: {output_path}")
+                    skipped_renders += 1
+                    continue
+
+                # Use testMe.json (localized version) instead of standAloneRender.json.
+                set_test_path = json_file_path.replace(STANDALONE_RENDER, TEST_ME_JSON)
+
+                render_tasks.append(RenderTask(
+                    cmd=self.build_freedview_command(
+                        freedview_exe, set_test_path, output_res, output_path,
+                        sequence_length, self.cluster_size
+                    ),
+                    fd_path=freedview_ver_path,
+                    output_path=output_path,
+                    freedview_ver_name=freedview_ver_name,
+                    json_file_path=json_file_path
+                ))
+
+        self._successful_renders += skipped_renders
+        if skipped_renders:
+            logger.info(
+                f"Skipping {skipped_renders} render(s) with complete output "
+                f"(use --force to re-render)"
+            )
+        total_renders = len(render_tasks) + self._successful_renders + self._failed_renders
 
         logger.info(
-            f"Starting parallel rendering with {self.max_workers} worker thread(s) "
-            f"for {total_renders} render task(s)"
+            f"Starting parallel rendering with {self.max_workers} worker process(es) "
+            f"for {len(render_tasks)} render task(s)"
         )
 
-        # Execute renders in parallel using ThreadPoolExecutor
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {
-                executor.submit(self._render_single_task, task): task
-                for task in render_tasks
-            }
+        # Execute renders in parallel on the persistent ProcessPoolExecutor.
+        executor = self._get_executor()
+        self._progress_counter = itertools.count(
+            1 + self._successful_renders + self._failed_renders
+        )
 
-            # Process completed tasks
-            for future in as_completed(futures):
-                task = futures[future]
-                try:
-                    success = future.result()
-                    if success:
-                        self._successful_renders += 1
-                    else:
-                        self._failed_renders += 1
-                except Exception as e:
-                    logger.error(
-                        f"Unexpected error in render task (version {task['freedview_ver_name']}, "
-                        f"file {os.path.basename(task['json_file_path'])}): {e}",
-                        exc_info=True
-                    )
+        futures = {
+            executor.submit(self._render_single_task, task): task
+            for task in render_tasks
+        }
+
+        # Process completed tasks. Progress is counted here in the parent, as tasks
+        # finish, so workers do not need to share a counter.
+        for future in as_completed(futures):
+            task = futures[future]
+            current_count = next(self._progress_counter)
+            progress_pct = int((current_count / total_renders) * 100)
+            logger.info(
+                f"Render progress: {current_count}/{total_renders} ({progress_pct}%) - "
+                f"Version: {task.freedview_ver_name}, "
+                f"File: {os.path.basename(task.json_file_path)}"
+            )
+            try:
+                success = future.result()
+                if success:
+                    self._successful_renders += 1
+                else:
                     self._failed_renders += 1
+            except Exception as e:
+                logger.error(
+                    f"Unexpected error in render task (version {task.freedview_ver_name}, "
+                    f"file {os.path.basename(task.json_file_path)}): {e}",
+                    exc_info=True
+                )
+                self._failed_renders += 1
 
         logger.info(
             f"Completed parallel rendering: {self._successful_renders} successful, "
@@ -191,126 +394,120 @@ class FreeDViewRunner:
         )
         logger.info("========================= Done FreedviewRunner ============================")
 
-    def _render_single_task(self, task: dict) -> bool:
+    @staticmethod
+    def _read_render_settings(
+        folder_frame: str,
+        json_file_path: str
+    ) -> Optional[Tuple[List[int], List[int]]]:
         """
-        Render a single task (one version + one JSON file) in a thread-safe manner.
+        Validate a frame folder and read the settings needed to render it.
 
         Args:
-            task: Dictionary containing render task parameters:
-                - version_index: Index of FreeDView version
-                - freedview_ver_path: Path to FreeDView version directory
-                - freedview_ver_name: Name of FreeDView version
-                - json_index: Index of JSON file
-                - json_file_path: Path to JSON file
-                - folder_frame: Path to frame folder
+            folder_frame: Path to frame folder
+            json_file_path: Path to JSON file
 
         Returns:
-            True if render succeeded, False otherwise
+            Tuple of (output_res, sequence_length), or None if the frame
+            cannot be rendered (the reason is logged)
         """
-        try:
-            # Thread-safe progress tracking
-            with self._progress_lock:
-                self._render_count += 1
-                current_count = self._render_count
-                total_renders = task.get('total_renders', 0)
-
-            if total_renders > 0:
-                progress_pct = int((current_count / total_renders) * 100)
-                logger.info(
-                    f"Render progress: {current_count}/{total_renders} ({progress_pct}%) - "
-                    f"Version: {task['freedview_ver_name']}, "
-                    f"File: {os.path.basename(task['json_file_path'])}"
-                )
-            else:
-                logger.info(
-                    f"Render task: Version {task['freedview_ver_name']}, "
-                    f"File {os.path.basename(task['json_file_path'])}"
-                )
+        # Verify required INI files exist in dynamicINIsBackup folder.
+        camera_control_ini = os.path.join(
+            folder_frame, DYNAMIC_INIS_BACKUP, CAMERA_CONTROL_INI
+        )
+        if not os.path.exists(camera_control_ini):
+            logger.error(
+                f"The {CAMERA_CONTROL_INI} is missing in "
+                f"{folder_frame}. Skipping render."
+            )
+            return None
 
-            # Verify required INI files exist in dynamicINIsBackup folder.
-            camera_control_ini = os.path.join(
-                task['folder_frame'], DYNAMIC_INIS_BACKUP, CAMERA_CONTROL_INI
+        campreset_ini = os.path.join(
+            folder_frame, DYNAMIC_INIS_BACKUP, CAMPRESET_INI
+        )
+        if not os.path.exists(campreset_ini):
+            logger.error(
+                f"The {CAMPRESET_INI} is missing in "
+                f"{folder_frame}. Skipping render."
             )
-            if not os.path.exists(camera_control_ini):
-                logger.error(
-                    f"The {CAMERA_CONTROL_INI} is missing in "
-                    f"{task['folder_frame']}. Skipping render."
-                )
-                return False
+            return None
 
-            campreset_ini = os.path.join(
-                task['folder_frame'], DYNAMIC_INIS_BACKUP, CAMPRESET_INI
+        # Read output resolution from camera control INI file.
+        try:
+            resolution = data_ini.get_many(
+                camera_control_ini, ['outputWidth', 'outputHeight']
             )
-            if not os.path.exists(campreset_ini):
+            output_width = resolution['outputWidth'][0]
+            output_height = resolution['outputHeight'][0]
+
+            if (output_width == data_ini.ERROR_VALUE or
+                    output_height == data_ini.ERROR_VALUE):
                 logger.error(
-                    f"The {CAMPRESET_INI} is missing in "
-                    f"{task['folder_frame']}. Skipping render."
+                    f"Failed to read output resolution from {camera_control_ini}"
                 )
-                return False
+                return None
 
-            # Read output resolution from camera control INI file.
-            try:
-                output_width = data_ini.getDataINI(camera_control_ini, 'outputWidth')[0]
-                output_height = data_ini.getDataINI(camera_control_ini, 'outputHeight')[0]
+            output_res = [int(output_width), int(output_height)]
+        except (ValueError, IndexError) as e:
+            logger.error(
+                f"Invalid output resolution in {camera_control_ini}: {e}"
+            )
+            return None
 
-                if (output_width == data_ini.ERROR_VALUE or
-                        output_height == data_ini.ERROR_VALUE):
-                    logger.error(
-                        f"Failed to read output resolution from {camera_control_ini}"
-                    )
-                    return False
+        # Read frame range from testMe.json file created by JsonLocalizer.
+        try:
+            json_data = _load_json(json_file_path)
+            sequence_length = [json_data['startFrame'], json_data['endFrame']]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
+            logger.error(f"Failed to read JSON file {json_file_path}: {e}")
+            return None
 
-                output_res = [int(output_width), int(output_height)]
-            except (ValueError, IndexError) as e:
-                logger.error(
-                    f"Invalid output resolution in {camera_control_ini}: {e}"
-                )
-                return False
+        return output_res, sequence_length
 
-            # Read frame range from testMe.json file created by JsonLocalizer.
-            try:
-                with open(task['json_file_path'], 'r', encoding='utf-8') as data_file:
-                    json_data = json.load(data_file)
-                    start_frame = json_data['startFrame']
-                    end_frame = json_data['endFrame']
-                    sequence_length = [start_frame, end_frame]
-            except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
-                logger.error(f"Failed to read JSON file {task['json_file_path']}: {e}")
-                return False
+    @staticmethod
+    def _render_single_task(task: RenderTask) -> bool:
+        """
+        Render a single task (one version + one JSON file) in a worker process.
 
-            # Create output directory structure: testSets_results/.../version_name.
-            # Replace existing output to ensure clean renders.
-            replace_path = task['folder_frame'].replace(
-                TEST_SETS_DIR, TEST_SETS_RESULTS_DIR
-            )
-            freedview_ver_path_dir = os.path.join(replace_path, task['freedview_ver'])
-            output_path = os.path.join(
-                freedview_ver_path_dir, task['freedview_ver_name']
+        Args:
+            task: Fully resolved render task from do_it()
+
+        Returns:
+            True if render succeeded, False otherwise
+        """
+        output_path = task.output_path
+        try:
+            logger.debug(
+                f"Render task: Version {task.freedview_ver_name}, "
+                f"File {os.path.basename(task.json_file_path)}"
             )
-            output_path = output_path.replace('\\', '/')
 
-            output_path_obj = Path(output_path)
-            if output_path_obj.exists():
+            # Replace existing output to ensure clean renders.
+            output_is_empty = True
+            if os.path.exists(output_path):
+                with os.scandir(output_path) as entries:
+                    output_is_empty = next(entries, None) is None
+            if not output_is_empty:
                 logger.debug(f"Removing existing output directory: {output_path}")
-                shutil.rmtree(output_path)
+                # Move the old output aside and delete it in the background, so the
+                # render does not wait for rmtree to finish.
+                scratch_path = f"{output_path}{DELETE_SCRATCH_SUFFIX}{uuid.uuid4().hex}"
+                try:
+                    os.replace(output_path, scratch_path)
+                    _cleanup_pool.submit(shutil.rmtree, scratch_path, ignore_errors=True)
+                except OSError:
+                    shutil.rmtree(output_path)
             try:
-                output_path_obj.mkdir(parents=True, exist_ok=True)
+                os.makedirs(output_path, exist_ok=True)
             except Exception as e:
                 logger.error(f"Failed to create output directory {output_path}: {e}")
                 return False
 
-            # Use testMe.json (localized version) instead of standAloneRender.json.
-            set_test_path = task['json_file_path'].replace(STANDALONE_RENDER, TEST_ME_JSON)
-            self.run_freedview(
-                task['freedview_ver_path'], set_test_path, output_res,
-                output_path, sequence_length
-            )
-            return True
+            return FreeDViewRunner.run_freedview(task.cmd, task.fd_path, output_path)
 
         except Exception as e:
             logger.error(
-                f"Error processing render (version {task['freedview_ver_name']}, "
-                f"file {task['json_file_path']}): {e}",
+                f"Error processing render (version {task.freedview_ver_name}, "
+                f"file {task.json_file_path}): {e}",
                 exc_info=True
             )
             return False
@@ -321,7 +518,7 @@ class FreeDViewRunner:
         freedview_ver: str,
         freedview_orig: str,
         freedview_test: str
-    ) -> Tuple[List[str], List[str]]:
+    ) -> List[Tuple[str, str]]:
         """
         Get all FreeDView versions from the folder path.
 
@@ -332,133 +529,146 @@ class FreeDViewRunner:
             freedview_test: Test version name
 
         Returns:
-            Tuple of (version_path_list, version_name_list)
+            List of (version_path, version_name) tuples, original version first
         """
-        freedview_ver_path_list = []
-        freedview_ver_name_list = []
+        freedview_versions = []
 
-        freedview_path_obj = Path(freedview_path)
-        if not freedview_path_obj.exists():
+        if not os.path.exists(freedview_path):
             logger.warning(f"FreeDView path does not exist: {freedview_path}")
-            return freedview_ver_path_list, freedview_ver_name_list
-
-        # Find the matching version folder
-        for item in freedview_path_obj.iterdir():
-            if not item.is_dir():
-                continue
-
-            if item.name == freedview_ver:
-                # Look for original and test versions inside
-                for sub_item in item.iterdir():
-                    if not sub_item.is_dir():
-                        continue
-
-                    dir_name = sub_item.name
-                    if dir_name == freedview_orig:
-                        freedview_ver_path_list.append(str(sub_item.absolute()))
-                        freedview_ver_name_list.append(dir_name)
-                        logger.debug(f"Found original version: {dir_name}")
-                    elif dir_name == freedview_test:
-                        freedview_ver_path_list.append(str(sub_item.absolute()))
-                        freedview_ver_name_list.append(dir_name)
-                        logger.debug(f"Found test version: {dir_name}")
-
-        return freedview_ver_path_list, freedview_ver_name_list
-
-    def run_freedview(
-        self,
-        fd_path: str,
+            return freedview_versions
+
+        # Both folder names are known, so look them up directly instead of
+        # scanning the FreeDView root: <freedview_path>/<freedview_ver>/<version>.
+        version_parent = os.path.join(freedview_path, freedview_ver)
+        if not os.path.isdir(version_parent):
+            return freedview_versions
+
+        found_names = set()
+        for dir_name, label in ((freedview_orig, "original"), (freedview_test, "test")):
+            version_path = os.path.join(version_parent, dir_name)
+            if dir_name not in found_names and os.path.isdir(version_path):
+                freedview_versions.append((os.path.abspath(version_path), dir_name))
+                found_names.add(dir_name)
+                logger.debug(f"Found {label} version: {dir_name}")
+
+        return freedview_versions
+
+    @staticmethod
+    def build_freedview_command(
+        freedview_exe: str,
         set_test_path: str,
         output_res: List[int],
         output_path: str,
-        sequence_length: List[int]
-    ) -> None:
+        sequence_length: List[int],
+        cluster_size: str = CLUSTER_SIZE
+    ) -> List[str]:
         """
-        Run FreeDView to create new images and rename them.
+        Build the FreeDView command line for one render.
+
+        FreeDView exports video frames as sequential images.
 
         Args:
-            fd_path: Path to FreeDView executable directory
+            freedview_exe: Path to the FreeDView executable
             set_test_path: Path to test JSON file
             output_res: Output resolution [width, height]
             output_path: Path where output images will be saved
             sequence_length: [start_frame, end_frame]
-        """
-        logger.info(f"Running FreeDView render: {os.path.basename(set_test_path)}")
-
-        output_res_x = output_res[0]
-        output_res_y = output_res[1]
-        start_frame = sequence_length[0]
-        end_frame = sequence_length[1]
-
-        # Build command line arguments for FreeDView executable.
-        # FreeDView exports video frames as sequential images.
-        freedview_exe = os.path.join(fd_path, FREEDVIEW_EXE)
-        
-        if not os.path.exists(freedview_exe):
-            logger.error(f"FreeDView executable not found: {freedview_exe}")
-            return
+            cluster_size: Value passed to FreeDView's -clusterSize option
 
+        Returns:
+            Command line arguments for subprocess
+        """
         output_file_path = os.path.join(output_path, OUTPUT_IMAGE_PREFIX)
 
-        cmd = [
+        return [
             freedview_exe,
             set_test_path,
             '-exportVideo',
-            '-imageSize', f'{output_res_x}x{output_res_y}',
+            '-imageSize', f'{output_res[0]}x{output_res[1]}',
             '-videoOutputPath', output_file_path,
-            '-clusterSize', CLUSTER_SIZE,
-            '-startFrame', str(start_frame),
-            '-endFrame', str(end_frame),
+            '-clusterSize', cluster_size,
+            '-startFrame', str(sequence_length[0]),
+            '-endFrame', str(sequence_length[1]),
             '-vidExportCameraName', VIDEO_EXPORT_CAMERA_NAME
         ]
 
+    @staticmethod
+    def run_freedview(cmd: List[str], fd_path: str, output_path: str) -> bool:
+        """
+        Run FreeDView to create new images and rename them.
+
+        Args:
+            cmd: FreeDView command line from build_freedview_command()
+            fd_path: Path to FreeDView executable directory
+            output_path: Path where output images will be saved
+
+        Returns:
+            True if FreeDView completed successfully, False otherwise
+        """
+        set_test_path = cmd[1]
+        logger.info(f"Running FreeDView render: {os.path.basename(set_test_path)}")
         logger.debug(f"FreeDView command: {' '.join(cmd)}")
 
         # Execute FreeDView renderer as subprocess.
-        # Capture stdout/stderr for error reporting.
+        # stdout is discarded, or spooled to a temp file when debug logging is on and
+        # only read back on failure; stderr is captured for error reporting.
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         try:
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                cwd=fd_path
-            )
-            stdout, stderr = process.communicate()
-
-            if process.returncode != 0:
-                error_msg = stderr.decode('utf-8', errors='ignore')
-                logger.error(
-                    f"FreeDView process failed with return code {process.returncode}. "
-                    f"Error: {error_msg}"
+            with (tempfile.TemporaryFile() if debug_enabled else nullcontext()) as stdout_file:
+                process = subprocess.run(
+                    cmd,
+                    stdout=stdout_file if debug_enabled else subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    cwd=fd_path,
+                    check=False,
+                    timeout=RENDER_TIMEOUT_SECONDS
                 )
-                return
-            else:
-                logger.debug("FreeDView process completed successfully")
 
+                if process.returncode != 0:
+                    error_msg = process.stderr.decode('utf-8', errors='ignore')
+                    logger.error(
+                        f"FreeDView process failed with return code {process.returncode}. "
+                        f"Error: {error_msg}"
+                    )
+                    if debug_enabled:
+                        stdout_file.seek(0)
+                        output = stdout_file.read().decode('utf-8', errors='ignore')
+                        logger.debug(f"FreeDView output: {output}")
+                    return False
+                else:
+                    logger.debug("FreeDView process completed successfully")
+
+        except subprocess.TimeoutExpired:
+            logger.error(
+                f"FreeDView render timed out after {RENDER_TIMEOUT_SECONDS} seconds: "
+                f"{set_test_path}"
+            )
+            return False
         except FileNotFoundError:
-            logger.error(f"FreeDView executable not found: {freedview_exe}")
-            return
+            logger.error(f"FreeDView executable not found: {cmd[0]}")
+            return False
         except Exception as e:
             logger.error(f"Exception running FreeDView: {e}", exc_info=True)
-            return
+            return False
 
         # Rename rendered images to sequential format (e.g., 0001.jpg, 0002.jpg).
         # FreeDView may generate files with different naming, so we standardize them.
-        output_path_obj = Path(output_path)
         renamed_count = 0
-        
+
         try:
-            for image_file in output_path_obj.iterdir():
-                if image_file.is_file():
-                    image_file_path = str(image_file)
-                    # Extract frame number from filename using regex.
-                    frame_numbers = re.findall(r'\d+', image_file_path)
-                    if frame_numbers:
-                        frame_index = frame_numbers[-1]
-                        new_image_path = output_path_obj / f"{frame_index}.jpg"
-                        if image_file_path != str(new_image_path):
-                            image_file.rename(new_image_path)
-                            renamed_count += 1
+            with os.scandir(output_path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    # Already in the target "<digits>.jpg" form: nothing to do.
+                    if name.endswith('.jpg') and name[:-4].isdigit():
+                        continue
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    # Extract frame number from the file name (last run of digits).
+                    frame_index = _trailing_number(name)
+                    if frame_index is not None:
+                        os.rename(entry.path, f"{output_path}/{frame_index}.jpg")
+                        renamed_count += 1
 
             if renamed_count > 0:
                 logger.debug(f"Renamed {renamed_count} image file(s)")
@@ -468,14 +678,20 @@ class FreeDViewRunner:
             logger.warning(f"Error renaming image files in {output_path}: {e}")
 
         logger.debug(f"Render completed for: {set_test_path}")
+        return True
 
 
-def run_freedview_runner() -> None:
-    """Run FreeDView runner as standalone script."""
+def run_freedview_runner(force: bool = False) -> None:
+    """
+    Run FreeDView runner as standalone script.
+
+    Args:
+        force: Re-render outputs that already contain every frame
+    """
     project_path = os.path.dirname(__file__)
     ini_path = os.path.join(project_path, 'freeDView_tester.ini')
-    freedview_runner = FreeDViewRunner()
-    freedview_runner.do_it(ini_path)
+    with FreeDViewRunner(force=force) as freedview_runner:
+        freedview_runner.do_it(ini_path)
 
 
 if __name__ == "__main__":
@@ -488,8 +704,13 @@ if __name__ == "__main__":
         dest="standalone",
         help="run script as stand alone"
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="re-render outputs that are already complete"
+    )
 
     args = parser.parse_args()
     if args.standalone:
         logger.info("Running FreeDView runner as stand alone process.")
-        run_freedview_runner()
+        run_freedview_runner(force=args.force)
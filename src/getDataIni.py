@@ -1,8 +1,10 @@
 """Module for reading configuration data from INI files."""
 import os
+import stat
 import logging
+import functools
 import configparser
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 # Constants
 ERROR_VALUE = 'error'
@@ -16,7 +18,73 @@ class INIReadError(Exception):
     pass
 
 
-def get_data_ini(file_path: str, tag_name: str, file_check: bool = False) -> List[str]:
+# Index of a parsed INI file: option name -> [(section, value), ...]
+OptionIndex = Dict[str, List[Tuple[str, str]]]
+
+
+@functools.lru_cache(maxsize=128)
+def _load_config(file_path: str, mtime_ns: int) -> OptionIndex:
+    """
+    Parse an INI file once per (absolute path, modification time).
+
+    Only a flat option index is cached, so repeated lookups on an unchanged
+    file are dict hits and do not re-open or re-parse it. The cached index
+    is shared and must be treated as read-only.
+
+    The index maps each (normalized) option name to its (section, value)
+    pairs in section order, so a key present in several sections keeps all
+    of its values and section-specific lookups need no ConfigParser.
+    Options only present in the DEFAULT section are indexed under
+    DEFAULT when no other section provides them.
+
+    Args:
+        file_path: Absolute path to the INI file
+        mtime_ns: Modification time of the file in nanoseconds, part of the cache
+            key so that edits to the file invalidate the cached parser
+
+    Returns:
+        Dictionary {option_name: [(section, value), ...]}
+
+    Raises:
+        INIReadError: If the file could not be read (may be empty or invalid)
+        configparser.Error: If the file could not be parsed
+    """
+    config = configparser.ConfigParser()
+    # Use read() with encoding for better compatibility
+    # Note: read() returns list of successfully read files
+    read_files = config.read(file_path, encoding='utf-8')
+    if not read_files:
+        raise INIReadError(f"Failed to read INI file (may be empty or invalid): {file_path}")
+
+    flat: OptionIndex = {}
+    for section_name in config.sections():
+        for option in config.options(section_name):
+            try:
+                flat.setdefault(option, []).append(
+                    (section_name, config.get(section_name, option))
+                )
+            except Exception as e:
+                logger.warning(f"Error reading option '{option}' from section '{section_name}': {e}")
+
+    # Fall back to the DEFAULT section for options no section provides
+    for option in config.defaults():
+        if option not in flat:
+            try:
+                flat[option] = [
+                    (configparser.DEFAULTSECT, config.get(configparser.DEFAULTSECT, option))
+                ]
+            except Exception as e:
+                logger.warning(f"Error reading option '{option}' from DEFAULT section: {e}")
+
+    return flat
+
+
+def get_data_ini(
+    file_path: str,
+    tag_name: str,
+    file_check: bool = False,
+    section: Optional[str] = None
+) -> List[str]:
     """
     Parse an INI file and return a list of values for the given tag/section.
     
@@ -27,15 +95,21 @@ def get_data_ini(file_path: str, tag_name: str, file_check: bool = False) -> Lis
         file_path: Path to the INI file
         tag_name: The key name to retrieve from the configuration
         file_check: If True, verify that the results are real files
+        section: If given, read the tag from this section only
     
     Returns:
         List of string values for the given tag, or [ERROR_VALUE] if file doesn't exist
         or if an error occurs. Exceptions are caught and logged for backward compatibility.
     """
-    return _get_data_ini_impl(file_path, tag_name, file_check)
+    return _get_data_ini_impl(file_path, tag_name, file_check, section)
 
 
-def getDataINI(file_path: str, tag_name: str, file_check: int = 0) -> List[str]:
+def getDataINI(
+    file_path: str,
+    tag_name: str,
+    file_check: int = 0,
+    section: Optional[str] = None
+) -> List[str]:
     """
     Legacy function name for backward compatibility.
     
@@ -43,20 +117,53 @@ def getDataINI(file_path: str, tag_name: str, file_check: int = 0) -> List[str]:
         file_path: Path to the INI file
         tag_name: The key name to retrieve from the configuration
         file_check: If 1, verify that the results are real files
+        section: If given, read the tag from this section only
     
     Returns:
         List of string values for the given tag, or [ERROR_VALUE] if file doesn't exist
         or if an error occurs. Exceptions are caught and logged for backward compatibility.
     """
-    return _get_data_ini_impl(file_path, tag_name, bool(file_check))
+    return _get_data_ini_impl(file_path, tag_name, bool(file_check), section)
+
+
+def get_many(
+    file_path: str,
+    tag_names: List[str],
+    file_check: bool = False,
+    section: Optional[str] = None
+) -> Dict[str, List[str]]:
+    """
+    Read several tags from an INI file with a single parse.
+    
+    Args:
+        file_path: Path to the INI file
+        tag_names: The key names to retrieve from the configuration
+        file_check: If True, verify that the results are real files
+        section: If given, read the tags from this section only
+    
+    Returns:
+        Dictionary mapping each tag name to its list of values, as returned by
+        get_data_ini(). Tags that are missing or fail map to [ERROR_VALUE].
+    """
+    loaded = _load_config_safe(file_path)
+    return {
+        tag_name: _lookup(loaded, file_path, tag_name, file_check, section)
+        for tag_name in tag_names
+    }
 
 
-def _get_data_ini_impl(file_path: str, tag_name: str, file_check: bool = False) -> List[str]:
+def _get_data_ini_impl(
+    file_path: str,
+    tag_name: str,
+    file_check: bool = False,
+    section: Optional[str] = None
+) -> List[str]:
     """
     Parse an INI file and return a list of values for the given tag/section.
     
     This function searches for the tag_name in all sections of the INI file.
     If the same key exists in multiple sections, all values will be returned.
+    When a section is given, only that section is read.
     
     For backward compatibility, all exceptions are caught and [ERROR_VALUE] is returned
     instead of raising exceptions. Errors are logged for debugging purposes.
@@ -65,70 +172,104 @@ def _get_data_ini_impl(file_path: str, tag_name: str, file_check: bool = False)
         file_path: Path to the INI file
         tag_name: The key name to retrieve from the configuration
         file_check: If True, verify that the results are real files
+        section: If given, read the tag from this section only
     
     Returns:
         List of string values for the given tag, or [ERROR_VALUE] if:
         - File doesn't exist
-        - Tag not found in any section
+        - Tag not found in any section (or in the given section)
         - file_check is True and any returned path doesn't exist
         - Any parsing or I/O error occurs
     """
+    return _lookup(_load_config_safe(file_path), file_path, tag_name, file_check, section)
+
+
+def _load_config_safe(file_path: str) -> Optional[OptionIndex]:
+    """
+    Load an INI file through the parse cache, logging instead of raising.
+    
+    Args:
+        file_path: Path to the INI file
+    
+    Returns:
+        Option index of the file, or None if the file is missing or cannot be
+        read or parsed
+    """
     if not file_path:
         logger.warning("Empty file_path provided to getDataINI")
-        return [ERROR_VALUE]
+        return None
     
-    if not os.path.exists(file_path):
+    # A single stat both checks existence and provides the cache key
+    try:
+        mtime_ns = os.stat(file_path).st_mtime_ns
+    except OSError:
         logger.warning(f"INI file not found: {file_path}")
-        return [ERROR_VALUE]
+        return None
     
     try:
-        config = configparser.ConfigParser()
-        # Use read() with encoding for better compatibility
-        # Note: read() returns list of successfully read files
-        read_files = config.read(file_path, encoding='utf-8')
-        if not read_files:
-            logger.error(f"Failed to read INI file (may be empty or invalid): {file_path}")
-            return [ERROR_VALUE]
+        return _load_config(os.path.abspath(file_path), mtime_ns)
+    except INIReadError as e:
+        logger.error(str(e))
     except configparser.Error as e:
         # Handle parsing errors (MissingSectionHeaderError, etc.)
         logger.error(f"Failed to parse INI file '{file_path}': {e}", exc_info=True)
-        return [ERROR_VALUE]
     except Exception as e:
         # Handle other unexpected errors (permission issues, etc.)
         logger.error(f"Unexpected error reading INI file '{file_path}': {e}", exc_info=True)
+    return None
+
+
+def _is_regular_file(path: str) -> bool:
+    """
+    Check that a path is an existing regular file with a single os.stat.
+    
+    Args:
+        path: Path to check
+    
+    Returns:
+        True if the path exists and is a regular file (symlinks are followed)
+    """
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return False
+
+
+def _lookup(
+    loaded: Optional[OptionIndex],
+    file_path: str,
+    tag_name: str,
+    file_check: bool,
+    section: Optional[str] = None
+) -> List[str]:
+    """
+    Look up a tag in a loaded INI file.
+    
+    Args:
+        loaded: Result of _load_config_safe()
+        file_path: Path to the INI file (for logging)
+        tag_name: The key name to retrieve from the configuration
+        file_check: If True, verify that the results are real files
+        section: If given, read the tag from this section only
+    
+    Returns:
+        List of string values for the given tag, or [ERROR_VALUE]
+    """
+    if loaded is None:
         return [ERROR_VALUE]
     
-    data_list = []
+    # Single dict lookup in the pre-built option index (ConfigParser lowercases
+    # option names by default)
+    entries = loaded.get(tag_name.lower(), ())
+    if section is not None:
+        data_list = [value for entry_section, value in entries if entry_section == section]
+    else:
+        data_list = [value for _, value in entries]
     
-    # Try to find the value in all sections
-    for section_name in config.sections():
-        if config.has_option(section_name, tag_name):
-            try:
-                value = config.get(section_name, tag_name)
-                # Handle values that might contain spaces - preserve them
-                data_list.append(value)
-            except (configparser.NoOptionError, configparser.NoSectionError):
-                # Should not happen due to has_option check, but handle gracefully
-                logger.debug(f"Unexpected error getting option '{tag_name}' from section '{section_name}'")
-                continue
-            except Exception as e:
-                logger.warning(f"Error reading option '{tag_name}' from section '{section_name}': {e}")
-                continue
-    
-    # If not found in sections, try DEFAULT section
-    if not data_list and config.has_option(configparser.DEFAULTSECT, tag_name):
-        try:
-            value = config.get(configparser.DEFAULTSECT, tag_name)
-            data_list.append(value)
-        except (configparser.NoOptionError, configparser.NoSectionError):
-            pass
-        except Exception as e:
-            logger.warning(f"Error reading option '{tag_name}' from DEFAULT section: {e}")
-    
-    # If file_check is enabled, verify all returned paths exist
+    # If file_check is enabled, verify all returned paths are real files
     if file_check:
         for item in data_list:
-            if not os.path.exists(item):
+            if not _is_regular_file(item):
                 logger.warning(f"File check failed: path does not exist: {item}")
                 return [ERROR_VALUE]
     
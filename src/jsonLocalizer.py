@@ -4,22 +4,245 @@ Phase 1: JSON Localizer
 This module changes all paths in "standAloneRender.json" files and writes new files
 called "testMe.json". The new paths are set to the local directory structure
 so FreeDView can render the sets.
+
+The JSON files are never parsed: their content is treated as opaque bytes and
+the event path is replaced with a plain byte-string substitution. A change that
+needs to edit the JSON structure itself would have to add a parsing step.
 """
 import os
+import re
+import mmap
+import shutil
 import logging
 import json
+import functools
 from pathlib import Path
-from typing import List, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, List, NamedTuple, Optional
 import getDataIni as data_ini
 
+try:
+    import re2 as _event_re_engine
+except ImportError:  # google-re2 is optional; fall back to the standard re module
+    _event_re_engine = re
+
+# Constants
+MAX_EVENT_DEPTH = 3  # SportType/Stadium/Category/Event
+STANDALONE_RENDER_JSON = "standAloneRender.json"
+TEST_ME_JSON = "testMe.json"
+_JSON_FOLDER_REL = 'Render/Json'  # Relative to a frame folder
+DEFAULT_MAX_WORKERS = 4  # Default number of parallel JSON rewrite threads
+MMAP_THRESHOLD_BYTES = 1 << 20  # JSON files at least this large are memory-mapped
+_O_BINARY = getattr(os, 'O_BINARY', 0)  # Needed on Windows to avoid newline translation
+
 # Configure module-level logger
 logger = logging.getLogger(__name__)
 
 
+class FrameRecord(NamedTuple):
+    """A frame folder found by JsonLocalizer.get_json_files(); all paths use '/'."""
+    set_path: str  # Set folder containing the frame
+    frame_path: str  # Frame folder (e.g., .../F0224)
+    frame_name: str  # Frame folder name (e.g., "F0224")
+    json_folder: str  # Render/Json folder of the frame
+    json_file: str  # standAloneRender.json path
+    event_path: str  # Event folder containing the set
+
+
+def _scan_dirs(path: str) -> Iterator[os.DirEntry]:
+    """
+    Yield the subdirectories of a directory.
+
+    os.scandir() reuses the file type returned with each directory entry, so
+    checking for directories does not cost an extra stat() per entry.
+
+    Args:
+        path: Directory to list
+
+    Yields:
+        os.DirEntry for each subdirectory
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                yield entry
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_event_pattern(event_name_set_test: str):
+    """
+    Compile an event name pattern into a regular expression.
+
+    Uses google-re2 (linear-time automaton) when it is installed, else re.
+
+    Args:
+        event_name_set_test: Pattern where '#' stands for any digit
+            (e.g., "E##_##_##_##_##_##__")
+
+    Returns:
+        Compiled regex matching folder names that start with the pattern
+    """
+    return _event_re_engine.compile(''.join(
+        '[0-9]' if char == '#' else re.escape(char) for char in event_name_set_test
+    ))
+
+
+@functools.lru_cache(maxsize=32)
+def _event_literal_prefix(event_name_set_test: str) -> str:
+    """
+    Get the literal part of an event name pattern before its first '#'.
+
+    Args:
+        event_name_set_test: Pattern where '#' stands for any digit
+
+    Returns:
+        Prefix every matching folder name starts with (e.g., "E")
+    """
+    return event_name_set_test.partition('#')[0]
+
+
+def _read_fd(fd: int, size: int) -> bytes:
+    """
+    Read up to size bytes from a file descriptor with os.read.
+
+    Args:
+        fd: Open file descriptor
+        size: Number of bytes to read
+
+    Returns:
+        The bytes read; shorter than size only at end of file
+    """
+    data = os.read(fd, size)
+    while len(data) < size:
+        chunk = os.read(fd, size - len(data))
+        if not chunk:
+            break
+        data += chunk
+    return data
+
+
+def _write_file(path: str, data: bytes) -> None:
+    """
+    Write a file with os.open/os.write, without a buffered file object.
+
+    Args:
+        path: File to create or truncate
+        data: Content to write
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _file_has_content(path: str, size: int, chunks: Iterable[bytes]) -> bool:
+    """
+    Check whether a file holds exactly the given content.
+
+    Args:
+        path: File to check
+        size: Total length of the expected content
+        chunks: Expected content, in order
+
+    Returns:
+        True if the file exists and its bytes equal the concatenated chunks
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY | _O_BINARY)
+    except OSError:
+        return False
+    try:
+        if os.fstat(fd).st_size != size:
+            return False
+        for chunk in chunks:
+            for start in range(0, len(chunk), MMAP_THRESHOLD_BYTES):
+                expected = chunk[start:start + MMAP_THRESHOLD_BYTES]
+                if _read_fd(fd, len(expected)) != expected:
+                    return False
+        return True
+    except OSError:
+        return False
+    finally:
+        os.close(fd)
+
+
+def _replace_in_file(src_path: str, dst_path: str, old: bytes, new: bytes) -> bool:
+    """
+    Copy a file, replacing every occurrence of a byte string.
+
+    Small files are read and written with single os.read/os.write calls.
+    Files of MMAP_THRESHOLD_BYTES or more are memory-mapped and written out in
+    chunks between matches, so they are never loaded into memory as a whole.
+    If the destination already holds the result (e.g., on a re-run), it is
+    left untouched; its size is checked first so most changes skip the compare.
+
+    Args:
+        src_path: File to read
+        dst_path: File to write
+        old: Byte string to replace (must not be empty)
+        new: Replacement byte string
+
+    Returns:
+        True if the destination was written, False if it was already up to date
+    """
+    fd = os.open(src_path, os.O_RDONLY | _O_BINARY)
+    try:
+        src_size = os.fstat(fd).st_size
+        if src_size < MMAP_THRESHOLD_BYTES:
+            data = _read_fd(fd, src_size).replace(old, new)
+            if _file_has_content(dst_path, len(data), (data,)):
+                return False
+            _write_file(dst_path, data)
+            return True
+        # The mapping keeps its own handle, so fd can be closed right away.
+        mapping = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+
+    with mapping as source, memoryview(source) as view:
+        positions = []
+        pos = source.find(old)
+        while pos >= 0:
+            positions.append(pos)
+            pos = source.find(old, pos + len(old))
+
+        def chunks() -> Iterator[bytes]:
+            start = 0
+            for match_pos in positions:
+                yield view[start:match_pos]
+                yield new
+                start = match_pos + len(old)
+            yield view[start:]
+
+        dst_size = src_size + len(positions) * (len(new) - len(old))
+        if _file_has_content(dst_path, dst_size, chunks()):
+            return False
+
+        if not positions:
+            shutil.copyfile(src_path, dst_path)
+            return True
+
+        with open(dst_path, 'wb') as dst:
+            dst.writelines(chunks())
+    return True
+
+
 class JsonLocalizer:
     """Handles JSON file localization for FreeDView rendering."""
 
-    def __init__(self):
+    __slots__ = ('max_workers', 'sport_folder_index', 'stadium_folder_index')
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        """
+        Initialize JsonLocalizer.
+
+        Args:
+            max_workers: Maximum number of parallel JSON rewrite threads (default: 4)
+        """
+        self.max_workers = max_workers
         self.sport_folder_index = 1
         self.stadium_folder_index = 1
 
@@ -37,9 +260,12 @@ class JsonLocalizer:
         event_name_tag = 'eventName'
         set_name_tag = 'setName'
 
-        json_file_path_set_test = data_ini.getDataINI(ini_path, set_test_path_tag)[0]
-        event_name_set_test = data_ini.getDataINI(ini_path, event_name_tag)[0]
-        set_name_set_test = data_ini.getDataINI(ini_path, set_name_tag)[0]
+        config = data_ini.get_many(
+            ini_path, [set_test_path_tag, event_name_tag, set_name_tag]
+        )
+        json_file_path_set_test = config[set_test_path_tag][0]
+        event_name_set_test = config[event_name_tag][0]
+        set_name_set_test = config[set_name_tag][0]
 
         # Validate INI data
         if json_file_path_set_test == data_ini.ERROR_VALUE:
@@ -49,19 +275,13 @@ class JsonLocalizer:
         # Search for all JSON files matching the event and set name patterns.
         # Set create_folders to False to avoid modifying directory structure.
         create_folders = False
-        (folder_set_list, folder_frame_list, frame_name_list,
-         json_folder_list, json_file_list,
-         event_with_set_path_list) = self.get_json_files(
+        frame_records = self.get_json_files(
             json_file_path_set_test, event_name_set_test,
             set_name_set_test, create_folders
         )
 
         # Create localized copies of JSON files with updated paths.
-        self.duplicate_and_modify_json_files(
-            json_file_path_set_test, folder_set_list, folder_frame_list,
-            frame_name_list, json_folder_list, json_file_list,
-            event_with_set_path_list
-        )
+        self._replace_path_in_json_files(json_file_path_set_test, frame_records)
 
     def get_json_files(
         self,
@@ -69,19 +289,21 @@ class JsonLocalizer:
         event_name_set_test: str,
         set_name_set_test: str,
         create_folders: bool
-    ) -> Tuple[List[str], List[str], List[str], List[str], List[str], List[str]]:
+    ) -> Iterator[FrameRecord]:
         """
         Find all JSON files in the directory structure.
 
+        Records are yielded as frame folders are found, so callers can start
+        working on them while the rest of the tree is still being scanned.
+
         Args:
             json_file_path: Base path to search for JSON files
             event_name_set_test: Pattern to match event names
             set_name_set_test: Pattern to match set names
             create_folders: Whether to create missing folder structures
 
-        Returns:
-            Tuple of lists: (folder_set_list, folder_frame_list, frame_name_list,
-                           json_folder_list, json_file_list, event_with_set_path_list)
+        Yields:
+            FrameRecord for each frame folder with a standAloneRender.json
         """
         event_path_list = []
         self.sport_folder_index = 1
@@ -89,161 +311,77 @@ class JsonLocalizer:
         # Traverse directory structure to find events.
         # Directory structure can be: Event, SportType/Event, SportType/Stadium/Event,
         # or SportType/Stadium/Category/Event.
-        base_path = Path(json_file_path)
-        if not base_path.exists():
+        if not os.path.exists(json_file_path):
             logger.warning(f"Base path does not exist: {json_file_path}")
-            return ([], [], [], [], [], [])
-
-        # Iterate through directories and identify events using pattern matching.
-        for item in base_path.iterdir():
-            if not item.is_dir():
-                continue
-
-            event_path = str(item)
-            self.stadium_folder_index = 1
-
-            # Check if current directory matches event pattern or needs deeper traversal.
-            is_event = self.is_event(event_name_set_test, event_path)
+            return
 
-            if not is_event:
-                # Not an event - this is a Sport Type folder, need to drill deeper.
-                event_path = self._traverse_sport_type(
-                    item, event_name_set_test, create_folders
-                )
-                if event_path:
+        # Top-down os.walk, pruned as it goes: event folders are recorded and not
+        # entered, other folders are only entered down to MAX_EVENT_DEPTH.
+        # child_depths maps each folder being walked to the depth of its children.
+        child_depths = {json_file_path: 0}
+        for root, dirs, _ in os.walk(json_file_path, followlinks=True):
+            depth = child_depths.pop(root)
+            if depth == 1:
+                self.stadium_folder_index = 1
+
+            # Match all folder names of this level in one batch, then check if
+            # each directory is an event or needs deeper traversal.
+            subfolders = []
+            for folder_name, matched in zip(dirs, self.match_many(event_name_set_test, dirs)):
+                event_path = os.path.join(root, folder_name)
+
+                if matched:
+                    # Events above Category level get the missing folders created.
+                    if create_folders and depth < 2:
+                        drilling_depth = 3 - depth
+                        event_path = self.create_extra_folder(event_path, drilling_depth)
                     event_path_list.append(event_path)
-            else:
-                # This is an event
-                if create_folders:
-                    drilling_depth = 3
-                    new_folder_path = self.create_extra_folder(
-                        event_path, drilling_depth
-                    )
-                    event_path = new_folder_path
-                event_path_list.append(event_path)
-
-        # Collect all sets and frames from found events.
-        folder_set_list = []
-        folder_frame_list = []
-        frame_name_list = []
-        json_folder_list = []
-        json_file_list = []
-        event_with_set_path_list = []
-
+                elif depth < MAX_EVENT_DEPTH:
+                    # Not an event - a Sport Type, Stadium or Category folder.
+                    subfolders.append(folder_name)
+                    child_depths[event_path] = depth + 1
+            dirs[:] = subfolders
+
+        # Collect all sets and frames from found events. Paths are normalized to
+        # forward slashes once per event and then only extended with '/'.
         for event_path in event_path_list:
-            event_path_obj = Path(event_path)
-            if not event_path_obj.exists():
+            if not os.path.exists(event_path):
                 continue
+            event_path = event_path.replace('\\', '/')
 
             # Iterate through sets in each event folder.
-            for set_item in event_path_obj.iterdir():
-                if not set_item.is_dir():
-                    continue
-
-                set_path = str(set_item)
+            for set_entry in _scan_dirs(event_path):
+                set_path = f"{event_path}/{set_entry.name}"
 
                 # Iterate through frames in each set folder.
-                for frame_item in set_item.iterdir():
-                    if not frame_item.is_dir():
-                        continue
-
-                    frame_path = str(frame_item)
-                    frame_name = frame_item.name
-
-                    # Validate frame name matches pattern (e.g., "F1234").
-                    # Frame names must start with 'F' followed by digits.
-                    split_string = frame_name.split('F')
-                    if len(split_string) == 2:
+                with os.scandir(set_path) as frame_entries:
+                    for frame_entry in frame_entries:
+                        frame_name = frame_entry.name
+
+                        # Validate frame name matches pattern (e.g., "F1234") first:
+                        # it needs no file system access, so other folders cost nothing.
+                        # Frame names must start with 'F' followed by digits.
+                        if not (len(frame_name) > 1 and frame_name[0] == 'F'
+                                and frame_name[1:].isdigit()):
+                            continue
+                        if not frame_entry.is_dir():
+                            continue
+
+                        # Locate the Render/Json folder containing standAloneRender.json.
+                        frame_path = f"{set_path}/{frame_name}"
+                        json_folder = f"{frame_path}/{_JSON_FOLDER_REL}"
+                        json_file = f"{json_folder}/{STANDALONE_RENDER_JSON}"
+
+                        # A single stat() call; a missing file raises and is skipped.
                         try:
-                            int(split_string[-1])  # Validate it's a number.
-
-                            # Locate the Render/Json folder containing standAloneRender.json.
-                            json_folder = os.path.join(frame_path, 'Render', 'Json')
-                            json_file = os.path.join(json_folder, 'standAloneRender.json')
-
-                            if os.path.exists(json_file):
-                                folder_set_list.append(set_path)
-                                folder_frame_list.append(frame_path)
-                                frame_name_list.append(frame_name)
-                                json_folder_list.append(json_folder)
-                                json_file_list.append(json_file.replace('\\', '/'))
-                                event_with_set_path_list.append(event_path)
-
-                        except ValueError:
-                            pass
-
-        return (folder_set_list, folder_frame_list, frame_name_list,
-                json_folder_list, json_file_list, event_with_set_path_list)
-
-    def _traverse_sport_type(
-        self,
-        sport_type_path: Path,
-        event_name_set_test: str,
-        create_folders: bool
-    ) -> Optional[str]:
-        """
-        Traverse sport type directory to find events.
-
-        Args:
-            sport_type_path: Path to sport type directory
-            event_name_set_test: Pattern to match event names
-            create_folders: Whether to create missing folders
-
-        Returns:
-            Event path if found, None otherwise
-        """
-        for stadium_item in sport_type_path.iterdir():
-            if not stadium_item.is_dir():
-                continue
+                            os.stat(json_file)
+                        except OSError:
+                            continue
 
-            stadium_path = str(stadium_item)
-            is_event = self.is_event(event_name_set_test, stadium_path)
-
-            if not is_event:
-                # Not an event - this is a Stadium Name folder, need to drill deeper.
-                event_path = self._traverse_stadium(
-                    stadium_item, event_name_set_test
-                )
-                if event_path:
-                    return event_path
-            else:
-                # Found an event at stadium level.
-                if create_folders:
-                    drilling_depth = 2
-                    new_folder_path = self.create_extra_folder(
-                        stadium_path, drilling_depth
-                    )
-                    return new_folder_path
-                return stadium_path
-
-        return None
-
-    def _traverse_stadium(
-        self,
-        stadium_path: Path,
-        event_name_set_test: str
-    ) -> Optional[str]:
-        """
-        Traverse stadium directory to find events.
-
-        Args:
-            stadium_path: Path to stadium directory
-            event_name_set_test: Pattern to match event names
-
-        Returns:
-            Event path if found, None otherwise
-        """
-        for category_item in stadium_path.iterdir():
-            if not category_item.is_dir():
-                        continue
-
-            category_path = str(category_item)
-            is_event = self.is_event(event_name_set_test, category_path)
-
-            if is_event:
-                return category_path
-
-        return None
+                        yield FrameRecord(
+                            set_path, frame_path, frame_name, json_folder,
+                            json_file, event_path
+                        )
 
     def create_extra_folder(
         self,
@@ -307,99 +445,147 @@ class JsonLocalizer:
         Returns:
             True if path matches event pattern, False otherwise
         """
-        split_path = os.path.basename(test_path)
+        return JsonLocalizer.is_event_name(event_name_set_test, os.path.basename(test_path))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def is_event_name(event_name_set_test: str, folder_name: str) -> bool:
+        """
+        Check if a folder name is an EVENT name, memoized per (pattern, name).
 
-        if len(split_path) < len(event_name_set_test):
+        Sport type, stadium and category names repeat across the tree, so most
+        lookups are cache hits.
+
+        Args:
+            event_name_set_test: Pattern to match (e.g., "E##_##_##_##_##_##__")
+            folder_name: Folder name (basename) to test
+
+        Returns:
+            True if the name matches event pattern, False otherwise
+        """
+        # Cheap rejects first: every pattern character matches exactly one
+        # character, and the pattern usually starts with a literal (e.g. "E").
+        if (len(folder_name) < len(event_name_set_test) or
+                not folder_name.startswith(_event_literal_prefix(event_name_set_test))):
             return False
 
-        match_count = 0
-        digits = {'0', '1', '2', '3', '4', '5', '6', '7', '8', '9'}
+        # '#' in pattern matches any digit in the name; the folder name must
+        # start with the whole pattern.
+        event_re = _compile_event_pattern(event_name_set_test)
+        return event_re.match(folder_name) is not None
 
-        # Compare pattern character by character.
-        # '#' in pattern matches any digit in the path.
-        for x in range(len(event_name_set_test)):
-            if event_name_set_test[x] == split_path[x]:
-                match_count += 1
-            elif event_name_set_test[x] == '#' and split_path[x] in digits:
-                match_count += 1
-            else:
-                break
+    @staticmethod
+    def match_many(event_name_set_test: str, paths: Iterable[str]) -> List[bool]:
+        """
+        Check many paths against an event pattern in one call.
+
+        The pattern is resolved once for the whole batch, so this is cheaper
+        than calling is_event() per path when scanning a folder.
 
-        # Require at least 20 matching characters to consider it an event.
-        # This threshold prevents false matches with similar folder names.
-        return match_count >= 20
+        Args:
+            event_name_set_test: Pattern to match (e.g., "E##_##_##_##_##_##__")
+            paths: Paths or folder names to test
+
+        Returns:
+            One bool per path, True where the path's basename matches the pattern
+        """
+        min_length = len(event_name_set_test)
+        prefix = _event_literal_prefix(event_name_set_test)
+        match = _compile_event_pattern(event_name_set_test).match
+        basename = os.path.basename
+        return [
+            len(name) >= min_length and name.startswith(prefix) and match(name) is not None
+            for name in map(basename, paths)
+        ]
 
     def duplicate_and_modify_json_files(
         self,
         json_file_path_set_test: str,
-        folder_set_list: List[str],
-        folder_frame_list: List[str],
-        frame_name_list: List[str],
-        json_folder_list: List[str],
-        json_file_list: List[str],
-        event_with_set_path_list: List[str]
+        frame_records: Iterable[FrameRecord]
     ) -> None:
         """
-        Duplicate and modify JSON files with localized paths.
+        Legacy method name for backward compatibility.
 
         Args:
             json_file_path_set_test: Base path for test sets
-            folder_set_list: List of set folder paths
-            folder_frame_list: List of frame folder paths
-            frame_name_list: List of frame names
-            json_folder_list: List of JSON folder paths
-            json_file_list: List of JSON file paths
-            event_with_set_path_list: List of event paths
+            frame_records: Frame folders from get_json_files()
         """
-        total_files = len(json_file_list)
-        logger.info(f"Processing {total_files} JSON file(s)")
+        self._replace_path_in_json_files(json_file_path_set_test, frame_records)
 
-        for i, json_file_path in enumerate(json_file_list):
-            if not os.path.exists(json_file_path):
-                logger.warning(f"File {json_file_path} does not exist! Skipping.")
-                continue
+    def _replace_path_in_json_files(
+        self,
+        json_file_path_set_test: str,
+        frame_records: Iterable[FrameRecord]
+    ) -> None:
+        """
+        Write testMe.json copies of the JSON files with localized event paths.
 
-            try:
-                with open(json_file_path, 'r', encoding='utf-8') as json_file:
-                    json_data = json_file.read()
-
-                # Extract event and set names from folder paths.
-                split_string = folder_frame_list[i].split('/')
-                event_name = os.path.basename(event_with_set_path_list[i])
-                set_name = os.path.basename(folder_set_list[i])
-
-                # Build old path pattern (Events/eventName/setName) and replace with new path.
-                # This localizes paths so FreeDView can find files in the test directory structure.
-                old_event_path = os.path.join(split_string[0], 'Events', event_name, set_name)
-                old_event_path = old_event_path.replace('\\', '/')
-
-                new_event_path = os.path.join(event_with_set_path_list[i], set_name)
-                new_event_path = new_event_path.replace('\\', '/')
-
-                # Replace all occurrences of old path with new path in JSON content.
-                modified_data = json_data.replace(old_event_path, new_event_path)
-
-                # Write localized JSON file as testMe.json for FreeDView to use.
-                json_file_dup = os.path.join(json_folder_list[i], 'testMe.json')
-                try:
-                    with open(json_file_dup, 'w', encoding='utf-8') as new_json_file:
-                        new_json_file.write(modified_data)
-                    logger.debug(f"Created localized JSON: {json_file_dup}")
-                except Exception as write_error:
-                    logger.error(
-                        f"Failed to write localized JSON file '{json_file_dup}': {write_error}"
-                    )
-                    continue
-
-            except Exception as e:
-                logger.error(f"Error processing {json_file_path}: {e}", exc_info=True)
-                continue
+        The files are handled as opaque bytes: the old event path is replaced
+        with the new one without parsing or decoding the JSON.
+
+        Args:
+            json_file_path_set_test: Base path for test sets
+            frame_records: Frame folders from get_json_files(); may be a generator,
+                in which case files are rewritten while the scan continues
+        """
+        total_files = 0
+        last_record = None
 
-        if event_with_set_path_list:
-            logger.info(f"Last processed event: {event_with_set_path_list[-1]}")
+        # Each file is read, rewritten and written independently, so overlap the
+        # file I/O on a thread pool. Records are submitted as they arrive.
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for last_record in frame_records:
+                executor.submit(self._localize_json_file, last_record)
+                total_files += 1
+
+        logger.info(f"Processed {total_files} JSON file(s)")
+        if last_record is not None:
+            logger.info(f"Last processed event: {last_record.event_path}")
 
         logger.info("========================= Done JsonLocalizer ============================")
 
+    def _localize_json_file(self, record: FrameRecord) -> None:
+        """
+        Write the localized testMe.json for one standAloneRender.json file.
+
+        Runs once per frame, so log messages use lazy %-formatting.
+
+        Args:
+            record: Frame folder from get_json_files()
+        """
+        json_file_path = record.json_file
+        if not os.path.exists(json_file_path):
+            logger.warning("File %s does not exist! Skipping.", json_file_path)
+            return
+
+        try:
+            # Extract event and set names from folder paths.
+            split_string = record.frame_path.split('/')
+            event_name = os.path.basename(record.event_path)
+            set_name = os.path.basename(record.set_path)
+
+            # Build old path pattern (Events/eventName/setName) and replace with new path.
+            # This localizes paths so FreeDView can find files in the test directory structure.
+            old_event_path = os.path.join(split_string[0], 'Events', event_name, set_name)
+            old_event_path = old_event_path.replace('\\', '/')
+
+            new_event_path = f"{record.event_path}/{set_name}"
+
+            # Replace all occurrences of old path with new path in JSON content and
+            # write localized JSON file as testMe.json for FreeDView to use.
+            # The content is handled as raw bytes, so it is never decoded.
+            json_file_dup = f"{record.json_folder}/{TEST_ME_JSON}"
+            if _replace_in_file(
+                json_file_path, json_file_dup,
+                old_event_path.encode('utf-8'), new_event_path.encode('utf-8')
+            ):
+                logger.debug("Created localized JSON: %s", json_file_dup)
+            else:
+                logger.debug("Localized JSON is up to date: %s", json_file_dup)
+
+        except Exception as e:
+            logger.error("Error processing %s: %s", json_file_path, e, exc_info=True)
+
 
 def run_json_localizer() -> None:
     """Run JSON localizer as standalone script."""
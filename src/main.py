@@ -54,7 +54,8 @@ def run_localize(args: argparse.Namespace) -> None:
     logger.info("Starting Phase 1: JSON Localizer")
     ini_path = get_ini_path(args.ini)
     try:
-        json_localizer_obj = json_localizer.JsonLocalizer()
+        max_workers = getattr(args, 'max_workers', 4)
+        json_localizer_obj = json_localizer.JsonLocalizer(max_workers=max_workers)
         json_localizer_obj.do_it(ini_path)
         logger.info("Phase 1 completed successfully")
     except Exception as e:
@@ -68,8 +69,11 @@ def run_render(args: argparse.Namespace) -> None:
     ini_path = get_ini_path(args.ini)
     try:
         max_workers = getattr(args, 'max_workers', 4)
-        freedview_runner = freeDViewRunner.FreeDViewRunner(max_workers=max_workers)
-        freedview_runner.do_it(ini_path)
+        force = getattr(args, 'force', False)
+        with freeDViewRunner.FreeDViewRunner(
+            max_workers=max_workers, force=force
+        ) as freedview_runner:
+            freedview_runner.do_it(ini_path)
         logger.info("Phase 2 completed successfully")
     except Exception as e:
         logger.error(f"Phase 2 failed: {e}")
@@ -82,7 +86,10 @@ def run_compare(args: argparse.Namespace) -> None:
     ini_path = get_ini_path(args.ini)
     try:
         max_workers = getattr(args, 'max_workers', 4)
-        render_compare = renderCompare.RenderCompare(ini_path, max_workers=max_workers)
+        use_processes = getattr(args, 'processes', False)
+        render_compare = renderCompare.RenderCompare(
+            ini_path, max_workers=max_workers, use_processes=use_processes
+        )
         logger.info("Phase 3 completed successfully")
     except Exception as e:
         logger.error(f"Phase 3 failed: {e}")
@@ -99,22 +106,28 @@ def run_all(args: argparse.Namespace) -> None:
         logger.info("=" * 50)
         logger.info("Phase 1: JSON Localizer")
         logger.info("=" * 50)
-        json_localizer_obj = json_localizer.JsonLocalizer()
+        max_workers = getattr(args, 'max_workers', 4)
+        json_localizer_obj = json_localizer.JsonLocalizer(max_workers=max_workers)
         json_localizer_obj.do_it(ini_path)
 
         # Phase 2: FreeDView Runner
         logger.info("=" * 50)
         logger.info("Phase 2: FreeDView Runner")
         logger.info("=" * 50)
-        max_workers = getattr(args, 'max_workers', 4)
-        freedview_runner = freeDViewRunner.FreeDViewRunner(max_workers=max_workers)
-        freedview_runner.do_it(ini_path)
+        force = getattr(args, 'force', False)
+        with freeDViewRunner.FreeDViewRunner(
+            max_workers=max_workers, force=force
+        ) as freedview_runner:
+            freedview_runner.do_it(ini_path)
 
         # Phase 3: Render Compare
         logger.info("=" * 50)
         logger.info("Phase 3: Render Compare")
         logger.info("=" * 50)
-        render_compare = renderCompare.RenderCompare(ini_path, max_workers=max_workers)
+        use_processes = getattr(args, 'processes', False)
+        render_compare = renderCompare.RenderCompare(
+            ini_path, max_workers=max_workers, use_processes=use_processes
+        )
 
         logger.info("=" * 50)
         logger.info("All phases completed successfully!")
@@ -214,6 +227,16 @@ Examples:
         default=4,
         help='Maximum number of parallel worker threads (default: 4)'
     )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Re-render outputs that already contain every frame'
+    )
+    parser.add_argument(
+        '--processes',
+        action='store_true',
+        help='Compare frame folders in worker processes instead of threads'
+    )
 
     # Subcommands
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
@@ -9,11 +9,13 @@ import logging
 import cv2
 import numpy as np
 from pathlib import Path
-from typing import List, Tuple, Optional
-from xml.dom import minidom
-from skimage.measure import structural_similarity as ssim
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
+from typing import Callable, Dict, List, Tuple, Optional
+from xml.sax.saxutils import XMLGenerator
+from concurrent.futures import (
+    FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+)
+from itertools import islice
+from threading import Lock, local
 import getDataIni as data_ini
 import jsonLocalizer as json_localizer
 
@@ -29,13 +31,86 @@ VERSION_SEPARATOR = "_VS_"
 # Image processing constants
 DILATION_KERNEL_SIZE = (5, 5)
 DILATION_ITERATIONS = 1
-SUPPORTED_IMAGE_EXTENSIONS = ['.jpg', '.png', '.jpeg']
+_DILATION_KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, DILATION_KERNEL_SIZE)
+_HOT_LUT = cv2.applyColorMap(  # 256x1x3 BGR table of COLORMAP_HOT, used as a user colormap
+    np.arange(256, dtype=np.uint8).reshape(256, 1), cv2.COLORMAP_HOT
+)
+
+# Encoder settings for the result images (lossless PNG at low zlib effort)
+DIFF_IMAGE_WRITE_PARAMS = [
+    cv2.IMWRITE_JPEG_QUALITY, 85,
+    cv2.IMWRITE_JPEG_OPTIMIZE, 0,
+    cv2.IMWRITE_JPEG_PROGRESSIVE, 0,
+]
+ALPHA_IMAGE_WRITE_PARAMS = [
+    cv2.IMWRITE_PNG_COMPRESSION, 1,
+    cv2.IMWRITE_PNG_STRATEGY, cv2.IMWRITE_PNG_STRATEGY_RLE,
+]
+SUPPORTED_IMAGE_EXTENSIONS = frozenset({'.jpg', '.png', '.jpeg'})
 DEFAULT_MAX_WORKERS = 4  # Default number of parallel comparison threads
+FRAME_PREFETCH_DEPTH = 2  # Frames read ahead of the busy frame workers
+
+# SSIM constants (Wang et al. 2004: 11x11 Gaussian window, sigma 1.5)
+SSIM_WINDOW_SIZE = 11
+SSIM_SIGMA = 1.5
+SSIM_K1 = 0.01
+SSIM_K2 = 0.03
+SSIM_DATA_RANGE = 255.0  # 8-bit images
+SSIM_REFERENCE_SIZE = 256  # Downsample so the shorter side is ~256 px before SSIM
+_SSIM_KERNEL = cv2.getGaussianKernel(SSIM_WINDOW_SIZE, SSIM_SIGMA, cv2.CV_32F)  # Separable taps
 
 # Configure module-level logger
 logger = logging.getLogger(__name__)
 
 
+def _posix(path: str) -> str:
+    """
+    Convert a native path to forward slashes.
+
+    Args:
+        path: Path string using the platform separator
+
+    Returns:
+        The path with forward slashes (unchanged on POSIX systems)
+    """
+    if os.sep == '/':
+        return path
+    return path.replace(os.sep, '/')
+
+
+def _scan_images(path: str) -> List[str]:
+    """
+    List the image files directly inside a directory.
+
+    Args:
+        path: Directory to scan
+
+    Returns:
+        Unsorted list of paths of files with a supported image extension
+    """
+    with os.scandir(path) as entries:
+        return [
+            entry.path for entry in entries
+            if os.path.splitext(entry.name)[1].lower() in SUPPORTED_IMAGE_EXTENSIONS
+            and entry.is_file()
+        ]
+
+
+def _mean_square(diff: np.ndarray) -> float:
+    """
+    Calculate the mean of the squared values of an 8-bit absolute-difference image.
+
+    Args:
+        diff: uint8 image with 1 to 4 channels, e.g. the result of cv2.absdiff
+
+    Returns:
+        Sum of the squared values over all channels divided by the pixel count,
+        equal to the MSE of the two images that produced diff
+    """
+    squared = cv2.multiply(diff, diff, dtype=cv2.CV_16U)
+    return float(sum(cv2.sumElems(squared))) / float(diff.shape[0] * diff.shape[1])
+
+
 def mean_squared_error(image_a: np.ndarray, image_b: np.ndarray) -> float:
     """
     Calculate the Mean Squared Error between two images.
@@ -56,25 +131,180 @@ def mean_squared_error(image_a: np.ndarray, image_b: np.ndarray) -> float:
             f"Got {image_a.shape} and {image_b.shape}"
         )
     
-    err = np.sum((image_a.astype("float") - image_b.astype("float")) ** 2)
+    if image_a is image_b:
+        return 0.0
+
+    if (image_a.dtype == np.uint8 and image_b.dtype == np.uint8 and
+            (image_a.ndim == 2 or (image_a.ndim == 3 and image_a.shape[2] <= 4))):
+        # Fast path for 8-bit images with up to 4 channels: |a - b| and its square
+        # fit in 8 and 16 bits, so no float copies of the images are needed, and
+        # OpenCV releases the GIL while comparing frames on worker threads.
+        return _mean_square(cv2.absdiff(image_a, image_b))
+
+    # General path: one float32 difference image; einsum fuses the square and
+    # the sum without materializing the squared array.
+    diff = np.subtract(image_a, image_b, dtype=np.float32).ravel()
+    err = float(np.einsum('i,i->', diff, diff))
     # Fix: Use total number of pixels (height * width)
     err /= float(image_a.shape[0] * image_a.shape[1])
     return err
 
 
+def _make_ssim_fn(shape: Tuple[int, int]) -> Callable[[np.ndarray, np.ndarray], float]:
+    """
+    Build an SSIM function specialized for one grayscale image shape.
+
+    The returned function reuses preallocated float32 scratch buffers for the
+    local statistics, so it does not allocate per call. It is not thread-safe; use one
+    per thread.
+
+    Args:
+        shape: (height, width) of the images the function will compare
+
+    Returns:
+        Function taking two images of that shape and returning their mean SSIM
+
+    Raises:
+        ValueError: If the shape is smaller than the SSIM window
+    """
+    if min(shape) < SSIM_WINDOW_SIZE:
+        raise ValueError(
+            f"Images must be at least {SSIM_WINDOW_SIZE}x{SSIM_WINDOW_SIZE} pixels. "
+            f"Got {shape}"
+        )
+
+    c1 = (SSIM_K1 * SSIM_DATA_RANGE) ** 2
+    c2 = (SSIM_K2 * SSIM_DATA_RANGE) ** 2
+    pad = SSIM_WINDOW_SIZE // 2
+    a, b, product, mu_a, mu_b, mu_a_sq, mu_b_sq, mu_ab, sigma_a_sq, sigma_b_sq, sigma_ab = (
+        np.empty(shape, dtype=np.float32) for _ in range(11)
+    )
+
+    def blur(image: np.ndarray, dst: np.ndarray) -> None:
+        cv2.sepFilter2D(
+            image, cv2.CV_32F, _SSIM_KERNEL, _SSIM_KERNEL, dst=dst,
+            borderType=cv2.BORDER_REFLECT
+        )
+
+    def ssim_fn(image_a: np.ndarray, image_b: np.ndarray) -> float:
+        # Center both images on a common offset before the float32 statistics:
+        # the variances are shift-invariant, and smaller magnitudes keep the
+        # E[x^2] - E[x]^2 cancellation accurate. The means get the offset back.
+        offset = round(cv2.mean(image_a)[0])
+        np.subtract(image_a, offset, out=a, dtype=np.float32)
+        np.subtract(image_b, offset, out=b, dtype=np.float32)
+
+        blur(a, mu_a)
+        blur(b, mu_b)
+        cv2.multiply(mu_a, mu_a, dst=mu_a_sq)
+        cv2.multiply(mu_b, mu_b, dst=mu_b_sq)
+        cv2.multiply(mu_a, mu_b, dst=mu_ab)
+        for x, y, mu_xy, sigma_xy in (
+            (a, a, mu_a_sq, sigma_a_sq), (b, b, mu_b_sq, sigma_b_sq), (a, b, mu_ab, sigma_ab)
+        ):
+            cv2.multiply(x, y, dst=product)
+            blur(product, sigma_xy)
+            cv2.subtract(sigma_xy, mu_xy, dst=sigma_xy)
+
+        # The luminance term needs the actual (unshifted) means.
+        np.add(mu_a, offset, out=mu_a)
+        np.add(mu_b, offset, out=mu_b)
+        cv2.multiply(mu_a, mu_a, dst=mu_a_sq)
+        cv2.multiply(mu_b, mu_b, dst=mu_b_sq)
+        cv2.multiply(mu_a, mu_b, dst=mu_ab)
+
+        # ssim_map = ((2 * mu_ab + c1) * (2 * sigma_ab + c2)) /
+        #            ((mu_a_sq + mu_b_sq + c1) * (sigma_a_sq + sigma_b_sq + c2)),
+        # computed in place in the statistics buffers.
+        np.multiply(mu_ab, 2, out=mu_ab)
+        np.add(mu_ab, c1, out=mu_ab)
+        np.multiply(sigma_ab, 2, out=sigma_ab)
+        np.add(sigma_ab, c2, out=sigma_ab)
+        np.multiply(mu_ab, sigma_ab, out=mu_ab)
+        np.add(mu_a_sq, mu_b_sq, out=mu_a_sq)
+        np.add(mu_a_sq, c1, out=mu_a_sq)
+        np.add(sigma_a_sq, sigma_b_sq, out=sigma_a_sq)
+        np.add(sigma_a_sq, c2, out=sigma_a_sq)
+        np.multiply(mu_a_sq, sigma_a_sq, out=mu_a_sq)
+        np.divide(mu_ab, mu_a_sq, out=mu_ab)
+
+        return float(cv2.mean(mu_ab[pad:-pad, pad:-pad])[0])
+
+    return ssim_fn
+
+
+def structural_similarity(image_a: np.ndarray, image_b: np.ndarray) -> float:
+    """
+    Calculate the mean Structural Similarity Index between two grayscale images.
+
+    Local statistics are computed with a separable Gaussian filter (cv2.sepFilter2D
+    with a cached kernel). As in scikit-image's Gaussian-weighted SSIM, the mean is
+    taken over the area where the window fits entirely inside the image.
+
+    Args:
+        image_a: First image array (8-bit grayscale)
+        image_b: Second image array (8-bit grayscale)
+
+    Returns:
+        SSIM value - 1.0 for identical images, lower for less similar images
+
+    Raises:
+        ValueError: If images have different dimensions or are smaller than the window
+    """
+    if image_a.shape != image_b.shape:
+        raise ValueError(
+            f"Images must have the same dimensions. "
+            f"Got {image_a.shape} and {image_b.shape}"
+        )
+    return _make_ssim_fn(image_a.shape[:2])(image_a, image_b)
+
+
+def downsample_for_ssim(image: np.ndarray) -> np.ndarray:
+    """
+    Average-pool an image by F = max(1, round(min(H, W) / 256)) before SSIM.
+
+    This is the automatic downsampling step of the reference SSIM implementation
+    (Wang et al.); it also cuts the SSIM work by a factor of F squared.
+
+    Args:
+        image: Image array to downsample
+
+    Returns:
+        Downsampled image, or the input image unchanged when F is 1
+    """
+    factor = max(1, round(min(image.shape[:2]) / SSIM_REFERENCE_SIZE))
+    if factor == 1:
+        return image
+    return cv2.resize(
+        image, None, fx=1.0 / factor, fy=1.0 / factor, interpolation=cv2.INTER_AREA
+    )
+
+
 class RenderCompare:
     """Handles comparison between rendered image sequences."""
 
-    def __init__(self, ini_path: Optional[str] = None, max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+    def __init__(
+        self,
+        ini_path: Optional[str] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        use_processes: bool = False
+    ) -> None:
         """
         Initialize RenderCompare.
 
         Args:
             ini_path: Path to the INI configuration file
-            max_workers: Maximum number of parallel comparison threads (default: 4)
+            max_workers: Maximum number of folders compared in parallel (default: 4)
+            use_processes: Compare folders in worker processes instead of threads
         """
         self.max_workers = max_workers
+        self.use_processes = use_processes
+        # Inner per-frame pool, sized so folder workers x frame workers <= CPU count
+        self.frame_workers = max(1, (os.cpu_count() or 1) // max(1, max_workers))
         self._progress_lock = Lock()
+        self._frame_buffers = local()  # Per-thread scratch buffers, see _get_frame_buffers
+        self._blank_images: Dict[Tuple[int, int], Tuple[bytes, bytes]] = {}  # Per frame size
+        self._path_cache: Dict[tuple, tuple] = {}  # See _collect_image_paths
         self._processed_folders = 0
         logger.info("-- RenderCompare --")
         if ini_path is not None:
@@ -121,11 +351,11 @@ class RenderCompare:
         # Use JsonLocalizer to locate all frame folders that contain rendered images.
         json_localizer_obj = json_localizer.JsonLocalizer()
         create_folders = None
-        get_json_info = json_localizer_obj.get_json_files(
+        frame_records = json_localizer_obj.get_json_files(
             set_test_path, event_name_set_test, set_name_set_test, create_folders
         )
 
-        folder_frame_list = get_json_info[1]
+        folder_frame_list = [record.frame_path for record in frame_records]
 
         if not folder_frame_list:
             logger.warning("No frame folders found to process")
@@ -133,8 +363,10 @@ class RenderCompare:
 
         total_folders = len(folder_frame_list)
         self._processed_folders = 0
+        worker_kind = "process(es)" if self.use_processes else "thread(s)"
         logger.info(
-            f"Processing {total_folders} frame folder(s) with {self.max_workers} parallel worker thread(s)"
+            f"Processing {total_folders} frame folder(s) with {self.max_workers} "
+            f"parallel worker {worker_kind}"
         )
 
         # Create list of comparison tasks
@@ -149,10 +381,22 @@ class RenderCompare:
                 'total_folders': total_folders
             })
 
-        # Execute comparisons in parallel using ThreadPoolExecutor
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        # Execute comparisons in parallel. Worker processes sidestep the GIL for the
+        # Python glue around the OpenCV calls; threads avoid the process start-up cost.
+        if self.use_processes:
+            executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_compare_worker,
+                initargs=(logging.getLogger().getEffectiveLevel(), self.max_workers)
+            )
+            compare_fn = _compare_single_folder_worker
+        else:
+            executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            compare_fn = self._compare_single_folder
+
+        with executor:
             futures = {
-                executor.submit(self._compare_single_folder, task): task
+                executor.submit(compare_fn, task): task
                 for task in comparison_tasks
             }
 
@@ -164,6 +408,11 @@ class RenderCompare:
                     if success:
                         with self._progress_lock:
                             self._processed_folders += 1
+                            folder_progress = int(self._processed_folders / total_folders * 100)
+                            logger.info(
+                                f"Folder progress: {self._processed_folders}/{total_folders} "
+                                f"folders ({folder_progress}%)"
+                            )
                 except Exception as e:
                     logger.error(
                         f"Unexpected error in comparison task for folder '{task['folder_frame']}': {e}",
@@ -209,14 +458,10 @@ class RenderCompare:
                     len(image_orig_list) > 1 and
                     freedview_path_orig and freedview_path_tester):
 
-                # Thread-safe progress logging
-                with self._progress_lock:
-                    current_processed = self._processed_folders + 1
-                    folder_progress = int((current_processed / task['total_folders']) * 100)
-                    logger.info(
-                        f"Folder progress: {current_processed}/{task['total_folders']} folders "
-                        f"({folder_progress}%) - Processing: {os.path.basename(task['folder_frame'])}"
-                    )
+                logger.info(
+                    f"Processing folder {task['folder_idx'] + 1}/{task['total_folders']}: "
+                    f"{os.path.basename(task['folder_frame'])}"
+                )
 
                 self.render_compare_do_it(
                     freedview_ver_path, image_orig_list, image_tester_list,
@@ -255,6 +500,9 @@ class RenderCompare:
         """
         Collect image paths from FreeDView version directories.
 
+        Results are cached per instance, so revisiting a folder does not list
+        its directories again.
+
         Args:
             freedview_ver_path: Path to FreeDView version directory
             freedview_name_orig: Name of original version
@@ -263,43 +511,46 @@ class RenderCompare:
         Returns:
             Tuple of (image_orig_list, image_tester_list, freedview_path_orig, freedview_path_tester)
         """
+        cache_key = (freedview_ver_path, freedview_name_orig, freedview_name_tester)
+        cached = self._path_cache.get(cache_key)
+        if cached is not None:
+            orig_images, tester_images, freedview_path_orig, freedview_path_tester = cached
+            return list(orig_images), list(tester_images), freedview_path_orig, freedview_path_tester
+
         image_orig_list = []
         image_tester_list = []
         freedview_path_orig = None
         freedview_path_tester = None
 
-        freedview_ver_path_obj = Path(freedview_ver_path)
-        if not freedview_ver_path_obj.exists():
+        try:
+            version_entries = list(os.scandir(freedview_ver_path))
+        except OSError:
             logger.debug(f"Path does not exist: {freedview_ver_path}")
             return image_orig_list, image_tester_list, freedview_path_orig, freedview_path_tester
 
-        for item in freedview_ver_path_obj.iterdir():
-            if not item.is_dir() or item.name == RESULTS_FOLDER:
+        for entry in version_entries:
+            if entry.name == RESULTS_FOLDER or not entry.is_dir():
                 continue
 
-            item_path = str(item)
-            item_name = item.name
-
-            if item_name == freedview_name_orig:
-                freedview_path_orig = item_path
+            if entry.name == freedview_name_orig:
+                freedview_path_orig = entry.path
                 # Collect all rendered image files from original version directory.
-                for image_file in item.iterdir():
-                    if (image_file.is_file() and 
-                            image_file.suffix.lower() in SUPPORTED_IMAGE_EXTENSIONS):
-                        image_orig_list.append(str(image_file))
+                image_orig_list = _scan_images(entry.path)
 
-            elif item_name == freedview_name_tester:
-                freedview_path_tester = item_path
+            elif entry.name == freedview_name_tester:
+                freedview_path_tester = entry.path
                 # Collect all rendered image files from test version directory.
-                for image_file in item.iterdir():
-                    if (image_file.is_file() and 
-                            image_file.suffix.lower() in SUPPORTED_IMAGE_EXTENSIONS):
-                        image_tester_list.append(str(image_file))
+                image_tester_list = _scan_images(entry.path)
 
         # Sort lists to ensure matching order
         image_orig_list.sort()
         image_tester_list.sort()
 
+        self._path_cache[cache_key] = (
+            tuple(image_orig_list), tuple(image_tester_list),
+            freedview_path_orig, freedview_path_tester
+        )
+
         return image_orig_list, image_tester_list, freedview_path_orig, freedview_path_tester
 
     def write_to_xml_file(
@@ -314,7 +565,9 @@ class RenderCompare:
         freedview_name_tester: str,
         sport_type: Optional[str] = None,
         stadium_name: Optional[str] = None,
-        category_name: Optional[str] = None
+        category_name: Optional[str] = None,
+        min_val: Optional[float] = None,
+        max_val: Optional[float] = None
     ) -> None:
         """
         Write comparison results to XML file.
@@ -331,6 +584,8 @@ class RenderCompare:
             sport_type: Optional sport type
             stadium_name: Optional stadium name
             category_name: Optional category name
+            min_val: Optional precomputed minimum of the SSIM list
+            max_val: Optional precomputed maximum of the SSIM list
 
         Raises:
             IOError: If XML file cannot be written
@@ -342,71 +597,65 @@ class RenderCompare:
         ssim_list = compare_type_list[1]
         if not ssim_list:
             raise ValueError("SSIM list is empty, cannot generate XML report")
+        if min_val is None:
+            min_val = min(ssim_list)
+        if max_val is None:
+            max_val = max(ssim_list)
 
-        result_xml_file = os.path.join(result_folder, COMPARE_RESULT_XML)
-        result_xml_file = result_xml_file.replace('\\', '/')
+        result_xml_file = _posix(os.path.join(result_folder, COMPARE_RESULT_XML))
 
         try:
-            root = minidom.Document()
-            xml_root = root.createElement('root')
-            root.appendChild(xml_root)
-
-            # Add paths
-            for path_name, path_value in [
-                ('sourcePath', path_list[0]),
-                ('testPath', path_list[1]),
-                ('diffPath', path_list[3]),
-                ('alphaPath', path_list[4])
-            ]:
-                element = root.createElement(path_name)
-                xml_root.appendChild(element)
-                element.appendChild(root.createTextNode(str(path_value)))
-
-            # Add version names
-            for version_name, version_value in [
-                ('origFreeDView', freedview_name_orig),
-                ('testFreedview', freedview_name_tester)
-            ]:
-                element = root.createElement(version_name)
-                xml_root.appendChild(element)
-                element.appendChild(root.createTextNode(str(version_value)))
-
-            # Add metadata
-            for meta_name, meta_value in [
-                ('eventName', event_name),
-                ('sportType', sport_type or ''),
-                ('stadiumName', stadium_name or ''),
-                ('categoryName', category_name or ''),
-                ('startFrame', start_frame),
-                ('endFrame', end_frame),
-                ('minVal', str(min(ssim_list))),
-                ('maxVal', str(max(ssim_list)))
-            ]:
-                element = root.createElement(meta_name)
-                xml_root.appendChild(element)
-                element.appendChild(root.createTextNode(str(meta_value)))
-
-            # Add frame data
-            frames = root.createElement('frames')
-            xml_root.appendChild(frames)
-
-            for x in range(len(ssim_list)):
-                frame_index = x + int(start_frame)
-                frame_child = root.createElement('frame')
-                frames.appendChild(frame_child)
-
-                frame_index_elem = root.createElement('frameIndex')
-                frame_index_elem.appendChild(root.createTextNode(str(frame_index)))
-                frame_child.appendChild(frame_index_elem)
-
-                value_elem = root.createElement('value')
-                value_elem.appendChild(root.createTextNode(str(ssim_list[x])))
-                frame_child.appendChild(value_elem)
-
-            xml_str = root.toprettyxml(indent="\t")
-            with open(result_xml_file, 'w', encoding='utf-8') as f:
-                f.write(xml_str)
-            
+            # Stream the report straight to the file; no document tree is built.
+            with open(result_xml_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                gen = XMLGenerator(f, 'utf-8', short_empty_elements=True)
+
+                def text_element(tag_name: str, tag_value: str, depth: int) -> None:
+                    gen.ignorableWhitespace('\n' + '\t' * depth)
+                    gen.startElement(tag_name, {})
+                    gen.characters(tag_value)
+                    gen.endElement(tag_name)
+
+                gen.startDocument()
+                gen.startElement('root', {})
+
+                # Add paths, version names and metadata
+                for tag_name, tag_value in [
+                    ('sourcePath', path_list[0]),
+                    ('testPath', path_list[1]),
+                    ('diffPath', path_list[3]),
+                    ('alphaPath', path_list[4]),
+                    ('origFreeDView', freedview_name_orig),
+                    ('testFreedview', freedview_name_tester),
+                    ('eventName', event_name),
+                    ('sportType', sport_type or ''),
+                    ('stadiumName', stadium_name or ''),
+                    ('categoryName', category_name or ''),
+                    ('startFrame', start_frame),
+                    ('endFrame', end_frame),
+                    ('minVal', str(min_val)),
+                    ('maxVal', str(max_val))
+                ]:
+                    text_element(tag_name, str(tag_value), 1)
+
+                # Add frame data
+                gen.ignorableWhitespace('\n\t')
+                gen.startElement('frames', {})
+                first_frame_index = int(start_frame)
+                for x, ssim_value in enumerate(ssim_list):
+                    gen.ignorableWhitespace('\n\t\t')
+                    gen.startElement('frame', {})
+                    text_element('frameIndex', str(x + first_frame_index), 3)
+                    text_element('value', str(ssim_value), 3)
+                    gen.ignorableWhitespace('\n\t\t')
+                    gen.endElement('frame')
+                gen.ignorableWhitespace('\n\t')
+                gen.endElement('frames')
+
+                gen.ignorableWhitespace('\n')
+                gen.endElement('root')
+                gen.ignorableWhitespace('\n')
+                gen.endDocument()
+
             logger.info(f"XML report written to: {result_xml_file}")
         except Exception as e:
             logger.error(f"Failed to write XML file '{result_xml_file}': {e}", exc_info=True)
@@ -458,8 +707,7 @@ class RenderCompare:
         path_list = [freedview_path_orig, freedview_path_tester]
 
         # Create results directory structure for comparison outputs.
-        result_folder = os.path.join(folder_frame_path, RESULTS_FOLDER)
-        result_folder = result_folder.replace('\\', '/')
+        result_folder = _posix(os.path.join(folder_frame_path, RESULTS_FOLDER))
         result_folder_obj = Path(result_folder)
         try:
             result_folder_obj.mkdir(parents=True, exist_ok=True)
@@ -474,8 +722,7 @@ class RenderCompare:
         )
 
         # Create directories for difference and alpha mask images.
-        diff_folder = os.path.join(result_folder, DIFF_IMAGES_FOLDER)
-        diff_folder = diff_folder.replace('\\', '/')
+        diff_folder = f'{result_folder}/{DIFF_IMAGES_FOLDER}'
         try:
             Path(diff_folder).mkdir(parents=True, exist_ok=True)
         except Exception as e:
@@ -483,8 +730,7 @@ class RenderCompare:
             return
         path_list.append(diff_folder)
 
-        alpha_folder = os.path.join(result_folder, ALPHA_IMAGES_FOLDER)
-        alpha_folder = alpha_folder.replace('\\', '/')
+        alpha_folder = f'{result_folder}/{ALPHA_IMAGES_FOLDER}'
         try:
             Path(alpha_folder).mkdir(parents=True, exist_ok=True)
         except Exception as e:
@@ -493,103 +739,64 @@ class RenderCompare:
         path_list.append(alpha_folder)
 
         # Compare all image pairs and calculate metrics.
-        result_mse_list = []
-        result_ssim_list = []
         failed_comparisons = 0
+        ssim_min = float('inf')
+        ssim_max = float('-inf')
 
         total_frames = len(image_orig_list)
-        logger.info(f"Comparing {total_frames} frame(s)")
+        logger.info(
+            f"Comparing {total_frames} frame(s) with {self.frame_workers} frame worker thread(s)"
+        )
 
         # Progress indication: log every 10% or every 10 frames, whichever is more frequent
         progress_interval = max(1, min(10, total_frames // 10))
         last_progress_log = -1
 
-        for i, (orig_image_path, test_image_path) in enumerate(
-            zip(image_orig_list, image_tester_list)
-        ):
-            # Log progress
-            if i % progress_interval == 0 or i == total_frames - 1:
-                progress_percent = int((i + 1) / total_frames * 100)
-                logger.info(f"Progress: {i + 1}/{total_frames} frames ({progress_percent}%)")
-                last_progress_log = i
-            try:
-                # Load images from disk for comparison.
-                source_frame = cv2.imread(orig_image_path)
-                tested_frame = cv2.imread(test_image_path)
-
-                if source_frame is None or tested_frame is None:
-                    logger.warning(
-                        f"Could not read image {orig_image_path} or {test_image_path}. "
-                        f"Skipping frame {i}"
-                    )
-                    failed_comparisons += 1
-                    continue
-
-                # Validate image dimensions
-                if source_frame.shape != tested_frame.shape:
-                    logger.warning(
-                        f"Image dimension mismatch at frame {i}: "
-                        f"{source_frame.shape} vs {tested_frame.shape}. Skipping"
+        # Frames are independent; OpenCV releases the GIL, so threads overlap
+        # disk I/O with compute. At most frame_workers + FRAME_PREFETCH_DEPTH frames
+        # are in flight, so reads run a little ahead of compute without queueing
+        # the whole sequence. Results are sorted by index to keep frame order.
+        frame_results = []
+        frame_pairs = enumerate(zip(image_orig_list, image_tester_list))
+        window_size = self.frame_workers + FRAME_PREFETCH_DEPTH
+        completed = 0
+        with ThreadPoolExecutor(max_workers=self.frame_workers) as executor:
+
+            def submit_frames(count: int) -> set:
+                return {
+                    executor.submit(
+                        self._process_frame, i, orig_image_path, test_image_path,
+                        start_frame, diff_folder, alpha_folder
                     )
-                    failed_comparisons += 1
-                    continue
-
-                # Convert to grayscale for comparison metrics (MSE and SSIM work on grayscale).
-                source_frame_gr = cv2.cvtColor(source_frame, cv2.COLOR_BGR2GRAY)
-                tested_frame_gr = cv2.cvtColor(tested_frame, cv2.COLOR_BGR2GRAY)
-
-                # Calculate Mean Squared Error (pixel-level difference metric).
-                try:
-                    mse_result = mean_squared_error(source_frame_gr, tested_frame_gr)
-                    result_mse_list.append(mse_result)
-                except ValueError as e:
-                    logger.warning(f"MSE calculation failed for frame {i}: {e}")
-                    mse_result = 0.0
-                    result_mse_list.append(mse_result)
-
-                # Calculate Structural Similarity Index (perceptual similarity metric).
-                try:
-                    ssim_result = ssim(source_frame_gr, tested_frame_gr)
-                    result_ssim_list.append(ssim_result)
-                except Exception as e:
-                    logger.warning(f"SSIM calculation failed for frame {i}: {e}")
-                    ssim_result = 0.0
-                    result_ssim_list.append(ssim_result)
-
-                # Create visual difference image showing pixel-level changes.
-                difference_image = cv2.absdiff(source_frame_gr, tested_frame_gr)
-
-                # Apply HOT colormap to difference image for better visualization.
-                # Hot colormap highlights differences in red/yellow colors.
-                im_color = cv2.applyColorMap(difference_image, cv2.COLORMAP_HOT)
-                frame_number = start_frame + i
-                counter = str(frame_number).zfill(4)
-                diff_image_path = os.path.join(diff_folder, f'{counter}.jpg')
-                
-                if not cv2.imwrite(diff_image_path, im_color):
-                    logger.warning(f"Failed to write diff image: {diff_image_path}")
-
-                # Create binary mask using Otsu thresholding to identify significant differences.
-                _, im_bw = cv2.threshold(
-                    difference_image, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU
-                )
-
-                # Create RGBA alpha image combining colored diff with binary mask as alpha channel.
-                # Apply dilation to make differences more visible.
-                b, g, r = cv2.split(im_color)
-                rgba = [b, g, r, im_bw]
-                im_alpha = cv2.merge(rgba)
-                kernel = np.ones(DILATION_KERNEL_SIZE, np.uint8)
-                dilation = cv2.dilate(im_alpha, kernel, iterations=DILATION_ITERATIONS)
-                alpha_image_path = os.path.join(alpha_folder, f'{counter}.png')
-                
-                if not cv2.imwrite(alpha_image_path, dilation):
-                    logger.warning(f"Failed to write alpha image: {alpha_image_path}")
-
-            except Exception as e:
-                logger.error(f"Error processing frame {i}: {e}", exc_info=True)
-                failed_comparisons += 1
-                continue
+                    for i, (orig_image_path, test_image_path) in islice(frame_pairs, count)
+                }
+
+            pending = submit_frames(window_size)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                pending |= submit_frames(len(done))
+
+                for future in done:
+                    # Log progress
+                    if completed % progress_interval == 0 or completed == total_frames - 1:
+                        progress_percent = int((completed + 1) / total_frames * 100)
+                        logger.info(
+                            f"Progress: {completed + 1}/{total_frames} frames ({progress_percent}%)"
+                        )
+                        last_progress_log = completed
+                    completed += 1
+
+                    frame_result = future.result()
+                    if frame_result is None:
+                        failed_comparisons += 1
+                    else:
+                        frame_results.append(frame_result)
+                        ssim_min = min(ssim_min, frame_result[2])
+                        ssim_max = max(ssim_max, frame_result[2])
+
+        frame_results.sort()
+        result_mse_list = [mse_result for _, mse_result, _ in frame_results]
+        result_ssim_list = [ssim_result for _, _, ssim_result in frame_results]
 
         # Log final progress if not already logged
         if last_progress_log < total_frames - 1:
@@ -620,12 +827,195 @@ class RenderCompare:
             self.write_to_xml_file(
                 result_folder, compare_type_list, start_frame_str, end_frame_str,
                 path_list, event_name, freedview_name_orig, freedview_name_tester,
-                sport_type, stadium_name, category_name
+                sport_type, stadium_name, category_name,
+                min_val=ssim_min, max_val=ssim_max
             )
             logger.info(f"Successfully completed comparison for: {folder_frame_path}")
         except Exception as e:
             logger.error(f"Failed to generate XML report: {e}", exc_info=True)
 
+    def _process_frame(
+        self,
+        i: int,
+        orig_image_path: str,
+        test_image_path: str,
+        start_frame: int,
+        diff_folder: str,
+        alpha_folder: str
+    ) -> Optional[Tuple[int, float, float]]:
+        """
+        Compare a single frame pair and write its diff and alpha images.
+
+        Args:
+            i: Index of the frame in the sequence
+            orig_image_path: Path to the original image
+            test_image_path: Path to the test image
+            start_frame: Frame number of the first image in the sequence
+            diff_folder: Output folder for diff images
+            alpha_folder: Output folder for alpha images
+
+        Returns:
+            Tuple of (i, mse, ssim), or None if the frame could not be compared
+        """
+        try:
+            # Load images from disk for comparison. MSE, SSIM and the diff images all
+            # work on grayscale, so decode straight to a single channel.
+            source_frame_gr = cv2.imread(orig_image_path, cv2.IMREAD_GRAYSCALE)
+            tested_frame_gr = cv2.imread(test_image_path, cv2.IMREAD_GRAYSCALE)
+
+            if source_frame_gr is None or tested_frame_gr is None:
+                logger.warning(
+                    f"Could not read image {orig_image_path} or {test_image_path}. "
+                    f"Skipping frame {i}"
+                )
+                return None
+
+            # Validate image dimensions
+            if source_frame_gr.shape != tested_frame_gr.shape:
+                logger.warning(
+                    f"Image dimension mismatch at frame {i}: "
+                    f"{source_frame_gr.shape} vs {tested_frame_gr.shape}. Skipping"
+                )
+                return None
+
+            # Per-thread output buffers, reused across frames of the same size.
+            buffers = self._get_frame_buffers(source_frame_gr.shape)
+
+            # Absolute difference feeds both the MSE and the visual outputs below.
+            difference_image = cv2.absdiff(source_frame_gr, tested_frame_gr, dst=buffers.diff)
+
+            counter = str(start_frame + i).zfill(4)
+            diff_image_path = f'{diff_folder}/{counter}.jpg'
+            alpha_image_path = f'{alpha_folder}/{counter}.png'
+
+            # Identical frames: the metrics are known and the diff/alpha images are blank.
+            if cv2.countNonZero(difference_image) == 0:
+                blank_diff_bytes, blank_alpha_bytes = self._get_blank_images(
+                    difference_image.shape
+                )
+                for image_path, image_bytes in (
+                    (diff_image_path, blank_diff_bytes), (alpha_image_path, blank_alpha_bytes)
+                ):
+                    try:
+                        with open(image_path, 'wb') as f:
+                            f.write(image_bytes)
+                    except OSError as e:
+                        logger.warning(f"Failed to write blank image {image_path}: {e}")
+                return i, 0.0, 1.0
+
+            # Calculate Mean Squared Error (pixel-level difference metric).
+            mse_result = _mean_square(difference_image)
+
+            # Calculate Structural Similarity Index (perceptual similarity metric).
+            # SSIM runs on downsampled copies; the diff images below keep full resolution.
+            try:
+                source_frame_small = downsample_for_ssim(source_frame_gr)
+                tested_frame_small = downsample_for_ssim(tested_frame_gr)
+                ssim_fn = self._get_ssim_fn(source_frame_small.shape)
+                ssim_result = ssim_fn(source_frame_small, tested_frame_small)
+            except Exception as e:
+                logger.warning(f"SSIM calculation failed for frame {i}: {e}")
+                ssim_result = 0.0
+
+            # Apply HOT colormap to difference image for better visualization.
+            # Hot colormap highlights differences in red/yellow colors.
+            im_color = cv2.applyColorMap(difference_image, _HOT_LUT, dst=buffers.color)
+
+            if not cv2.imwrite(diff_image_path, im_color, DIFF_IMAGE_WRITE_PARAMS):
+                logger.warning(f"Failed to write diff image: {diff_image_path}")
+
+            # Create binary mask using Otsu thresholding to identify significant differences.
+            _, im_bw = cv2.threshold(
+                difference_image, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU,
+                dst=buffers.mask
+            )
+
+            # Create RGBA alpha image combining colored diff with binary mask as alpha channel.
+            # Apply dilation to make differences more visible.
+            buffers.rgba[..., :3] = im_color
+            buffers.rgba[..., 3] = im_bw
+            dilation = cv2.dilate(
+                buffers.rgba, _DILATION_KERNEL, dst=buffers.dilation,
+                iterations=DILATION_ITERATIONS
+            )
+
+            if not cv2.imwrite(alpha_image_path, dilation, ALPHA_IMAGE_WRITE_PARAMS):
+                logger.warning(f"Failed to write alpha image: {alpha_image_path}")
+
+            return i, mse_result, ssim_result
+
+        except Exception as e:
+            logger.error(f"Error processing frame {i}: {e}", exc_info=True)
+            return None
+
+    def _get_blank_images(self, shape: Tuple[int, int]) -> Tuple[bytes, bytes]:
+        """
+        Get the encoded diff and alpha images of an identical frame pair.
+
+        An all-zero difference maps to a black HOT image and an empty Otsu mask,
+        so both outputs are all zeros. They are encoded once per frame size.
+
+        Args:
+            shape: (height, width) of the frame
+
+        Returns:
+            Tuple of (diff_jpg_bytes, alpha_png_bytes)
+        """
+        blank_images = self._blank_images.get(shape)
+        if blank_images is None:
+            _, diff_bytes = cv2.imencode(
+                '.jpg', np.zeros((*shape, 3), dtype=np.uint8), DIFF_IMAGE_WRITE_PARAMS
+            )
+            _, alpha_bytes = cv2.imencode(
+                '.png', np.zeros((*shape, 4), dtype=np.uint8), ALPHA_IMAGE_WRITE_PARAMS
+            )
+            blank_images = (diff_bytes.tobytes(), alpha_bytes.tobytes())
+            self._blank_images[shape] = blank_images
+        return blank_images
+
+    def _get_frame_buffers(self, shape: Tuple[int, int]) -> local:
+        """
+        Get the calling thread's output buffers for a frame size.
+
+        The buffers are reused across frames and only reallocated when the
+        frame size changes.
+
+        Args:
+            shape: (height, width) of the frame
+
+        Returns:
+            Thread-local namespace with uint8 buffers diff (H, W), color (H, W, 3),
+            mask (H, W), rgba (H, W, 4) and dilation (H, W, 4)
+        """
+        buffers = self._frame_buffers
+        if getattr(buffers, 'shape', None) != shape:
+            buffers.shape = shape
+            buffers.diff = np.empty(shape, dtype=np.uint8)
+            buffers.color = np.empty((*shape, 3), dtype=np.uint8)
+            buffers.mask = np.empty(shape, dtype=np.uint8)
+            buffers.rgba = np.empty((*shape, 4), dtype=np.uint8)
+            buffers.dilation = np.empty((*shape, 4), dtype=np.uint8)
+        return buffers
+
+    def _get_ssim_fn(self, shape: Tuple[int, int]) -> Callable[[np.ndarray, np.ndarray], float]:
+        """
+        Get the calling thread's SSIM function for a frame size.
+
+        All frames of a folder share one size, so the function and its scratch
+        buffers are normally built once per thread.
+
+        Args:
+            shape: (height, width) of the (downsampled) frame
+
+        Returns:
+            SSIM function from _make_ssim_fn for that shape
+        """
+        buffers = self._frame_buffers
+        if getattr(buffers, 'ssim_shape', None) != shape:
+            buffers.ssim_fn = _make_ssim_fn(shape)
+            buffers.ssim_shape = shape
+        return buffers.ssim_fn
+
     def _extract_metadata_from_path(
         self, result_folder: str
     ) -> Tuple[str, str, str, str]:
@@ -669,6 +1059,35 @@ class RenderCompare:
         return event_name, sport_type, stadium_name, category_name
 
 
+_worker_compare: Optional[RenderCompare] = None  # Per-process instance, see _init_compare_worker
+
+
+def _init_compare_worker(log_level: int, max_workers: int) -> None:
+    """
+    Initialize a folder comparison worker process.
+
+    Args:
+        log_level: Root logger level of the parent process
+        max_workers: Folder worker count of the parent, used to size the frame pool
+    """
+    global _worker_compare
+    logging.getLogger().setLevel(log_level)
+    _worker_compare = RenderCompare(max_workers=max_workers)
+
+
+def _compare_single_folder_worker(task: dict) -> bool:
+    """
+    Compare a single frame folder in a worker process.
+
+    Args:
+        task: Comparison task, see RenderCompare._compare_single_folder
+
+    Returns:
+        True if comparison succeeded, False otherwise
+    """
+    return _worker_compare._compare_single_folder(task)
+
+
 def run_render_compare() -> None:
     """Run render compare as standalone script."""
     project_path = os.path.dirname(__file__)
@@ -1,2 +1,7 @@
 """Unit tests for FreeDView Tester."""
+import os
+import sys
 
+# The modules under test live in src/ and import each other as top-level
+# modules; make them importable once for every test module in this package.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
@@ -6,19 +6,17 @@ import tempfile
 import os
 import configparser
 
-import sys
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
-
 import getDataIni
 
 
 class TestGetDataIni(unittest.TestCase):
     """Test cases for getDataIni module."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_ini_path = os.path.join(self.temp_dir, 'test.ini')
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by all tests (read-only)."""
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.test_ini_path = os.path.join(cls.temp_dir, 'test.ini')
         
         # Create a test INI file
         config = configparser.ConfigParser()
@@ -28,13 +26,14 @@ class TestGetDataIni(unittest.TestCase):
             'testNumber': '123'
         }
         
-        with open(self.test_ini_path, 'w') as f:
+        with open(cls.test_ini_path, 'w') as f:
             config.write(f)
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up after tests."""
         import shutil
-        shutil.rmtree(self.temp_dir)
+        shutil.rmtree(cls.temp_dir)
 
     def test_get_data_ini_existing_key(self):
         """Test reading existing key from INI file."""
@@ -78,6 +77,56 @@ class TestGetDataIni(unittest.TestCase):
         result = getDataIni.getDataINI(ini_path, 'testPath', file_check=1)
         self.assertEqual(result[0], 'error')
 
+    def test_get_many(self):
+        """Test reading several keys with a single call."""
+        result = getDataIni.get_many(self.test_ini_path, ['testKey', 'testNumber', 'nonexistent'])
+        self.assertEqual(result['testKey'][0], 'testValue')
+        self.assertEqual(result['testNumber'][0], '123')
+        self.assertEqual(result['nonexistent'][0], 'error')
+
+    def test_get_many_nonexistent_file(self):
+        """Test get_many on a non-existent file returns error for every key."""
+        result = getDataIni.get_many('/nonexistent/path.ini', ['testKey', 'testPath'])
+        self.assertEqual(result, {'testKey': ['error'], 'testPath': ['error']})
+
+    def test_get_data_ini_with_section(self):
+        """Test reading a key from a named section."""
+        config = configparser.ConfigParser()
+        config['first'] = {'sharedKey': 'firstValue'}
+        config['second'] = {'sharedKey': 'secondValue'}
+        ini_path = os.path.join(self.temp_dir, 'sections.ini')
+        with open(ini_path, 'w') as f:
+            config.write(f)
+
+        result = getDataIni.get_data_ini(ini_path, 'sharedKey', section='second')
+        self.assertEqual(result, ['secondValue'])
+        result = getDataIni.get_data_ini(ini_path, 'sharedKey')
+        self.assertEqual(result, ['firstValue', 'secondValue'])
+
+    def test_get_data_ini_with_missing_section(self):
+        """Test reading a key from a non-existent section returns error."""
+        result = getDataIni.get_data_ini(self.test_ini_path, 'testKey', section='missing')
+        self.assertEqual(result[0], 'error')
+
+    def test_get_data_ini_reflects_file_changes(self):
+        """Test cached parse is invalidated when the INI file is modified."""
+        # Uses its own file; the shared test.ini must stay unchanged
+        ini_path = os.path.join(self.temp_dir, 'changing.ini')
+        config = configparser.ConfigParser()
+        config['test_section'] = {'testKey': 'testValue'}
+        with open(ini_path, 'w') as f:
+            config.write(f)
+        self.assertEqual(getDataIni.getDataINI(ini_path, 'testKey')[0], 'testValue')
+
+        config['test_section'] = {'testKey': 'newValue'}
+        with open(ini_path, 'w') as f:
+            config.write(f)
+        mtime = os.path.getmtime(ini_path) + 10
+        os.utime(ini_path, (mtime, mtime))
+
+        result = getDataIni.getDataINI(ini_path, 'testKey')
+        self.assertEqual(result[0], 'newValue')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -6,24 +6,28 @@ import tempfile
 import os
 import json
 
-import sys
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
-
 from jsonLocalizer import JsonLocalizer
 
 
 class TestJsonLocalizer(unittest.TestCase):
     """Test cases for JsonLocalizer module."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.json_localizer = JsonLocalizer()
+    @classmethod
+    def setUpClass(cls):
+        """Set up a temporary folder shared by all tests."""
+        cls.class_temp_dir = tempfile.mkdtemp()
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up after tests."""
         import shutil
-        shutil.rmtree(self.temp_dir)
+        shutil.rmtree(cls.class_temp_dir)
+
+    def setUp(self):
+        """Set up test fixtures."""
+        # Per-test folder name; tests that need files create it with os.makedirs
+        self.temp_dir = os.path.join(self.class_temp_dir, self._testMethodName)
+        self.json_localizer = JsonLocalizer()
 
     def test_is_event_matching_pattern(self):
         """Test event pattern matching with matching pattern."""
@@ -53,6 +57,82 @@ class TestJsonLocalizer(unittest.TestCase):
         result = self.json_localizer.is_event(pattern, test_path)
         self.assertTrue(result, "Should match pattern with digits")
 
+    def test_is_event_rejects_non_digit_wildcard(self):
+        """Test '#' only matches digits."""
+        pattern = "E##_##_##_##_##_##__"
+        test_path = "/some/path/E1a_34_56_78_90_12__"
+        self.assertFalse(self.json_localizer.is_event(pattern, test_path))
+
+    def test_is_event_escapes_regex_characters(self):
+        """Test pattern characters other than '#' are matched literally."""
+        pattern = "E##.(##)+"
+        self.assertTrue(self.json_localizer.is_event(pattern, "/some/path/E12.(34)+"))
+        self.assertFalse(self.json_localizer.is_event(pattern, "/some/path/E12x(34)+"))
+        self.assertFalse(self.json_localizer.is_event(pattern, "/some/path/E12.3434"))
+
+    def test_match_many_agrees_with_is_event(self):
+        """Test match_many gives the same answer as is_event for each path."""
+        pattern = "E##_##_##_##_##_##__"
+        paths = [
+            "/some/path/E12_34_56_78_90_12__",
+            "/some/path/SomeOtherFolder",
+            "/some/path/E12",
+            "/some/path/E1a_34_56_78_90_12__",
+            "E98_76_54_32_10_00__",
+        ]
+        expected = [self.json_localizer.is_event(pattern, path) for path in paths]
+        self.assertEqual(self.json_localizer.match_many(pattern, paths), expected)
+        self.assertEqual(expected, [True, False, False, False, True])
+
+    def test_get_json_files_finds_frames(self):
+        """Test get_json_files collects frames at several event depths."""
+        pattern = "E##_##_##_##_##_##__"
+        frame_paths = [
+            os.path.join(self.temp_dir, 'E12_34_56_78_90_12__', 'S1', 'F0001'),
+            os.path.join(self.temp_dir, 'NFL', 'E12_34_56_78_90_13__', 'S1', 'F0002'),
+            os.path.join(self.temp_dir, 'NFL', 'E12_34_56_78_90_14__', 'S1', 'F0004'),
+            os.path.join(self.temp_dir, 'NFL', 'Stadium', 'Category',
+                         'E12_34_56_78_90_15__', 'S1', 'F0005'),
+        ]
+        for frame_path in frame_paths:
+            json_folder = os.path.join(frame_path, 'Render', 'Json')
+            os.makedirs(json_folder)
+            with open(os.path.join(json_folder, 'standAloneRender.json'), 'w') as f:
+                json.dump({}, f)
+        # Not a frame folder, and a frame without a JSON file
+        os.makedirs(os.path.join(self.temp_dir, 'E12_34_56_78_90_12__', 'S1', 'Other'))
+        os.makedirs(os.path.join(self.temp_dir, 'E12_34_56_78_90_12__', 'S1', 'F0003'))
+
+        records = list(self.json_localizer.get_json_files(self.temp_dir, pattern, '', False))
+        folder_frame_list = [record.frame_path for record in records]
+        frame_name_list = [record.frame_name for record in records]
+        self.assertEqual(
+            sorted(folder_frame_list),
+            sorted(frame_path.replace('\\', '/') for frame_path in frame_paths)
+        )
+        self.assertEqual(sorted(frame_name_list), ['F0001', 'F0002', 'F0004', 'F0005'])
+
+    def test_duplicate_and_modify_json_files(self):
+        """Test testMe.json is created and not rewritten when unchanged."""
+        pattern = "E##_##_##_##_##_##__"
+        event_path = os.path.join(self.temp_dir, 'E12_34_56_78_90_12__')
+        json_folder = os.path.join(event_path, 'S1', 'F0001', 'Render', 'Json')
+        os.makedirs(json_folder)
+        with open(os.path.join(json_folder, 'standAloneRender.json'), 'w') as f:
+            json.dump({'path': 'D:/Events/E12_34_56_78_90_12__/S1/data.bin'}, f)
+
+        records = list(self.json_localizer.get_json_files(self.temp_dir, pattern, '', False))
+        self.json_localizer.duplicate_and_modify_json_files(self.temp_dir, records)
+
+        test_me_path = os.path.join(json_folder, 'testMe.json')
+        with open(test_me_path) as f:
+            data = json.load(f)
+        self.assertTrue(data['path'].endswith('/S1/data.bin'))
+
+        os.utime(test_me_path, (0, 0))
+        self.json_localizer.duplicate_and_modify_json_files(self.temp_dir, records)
+        self.assertEqual(os.stat(test_me_path).st_mtime, 0)
+
 
 if __name__ == '__main__':
     unittest.main()
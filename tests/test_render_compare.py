@@ -6,65 +6,107 @@ import numpy as np
 import cv2
 import tempfile
 import os
+import xml.etree.ElementTree as ET
 from pathlib import Path
 
-import sys
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
-
-from renderCompare import mean_squared_error
+from renderCompare import RenderCompare, downsample_for_ssim, mean_squared_error, structural_similarity
 
 
 class TestRenderCompare(unittest.TestCase):
     """Test cases for renderCompare module."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        # Create temporary test images
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_image1_path = os.path.join(self.temp_dir, 'test1.jpg')
-        self.test_image2_path = os.path.join(self.temp_dir, 'test2.jpg')
-        
-        # Create simple test images (100x100, grayscale)
-        test_image1 = np.ones((100, 100), dtype=np.uint8) * 128
-        test_image2 = np.ones((100, 100), dtype=np.uint8) * 130
-        
-        cv2.imwrite(self.test_image1_path, test_image1)
-        cv2.imwrite(self.test_image2_path, test_image2)
-
-    def tearDown(self):
+    # Reference images shared by the metric tests (treat as read-only)
+    IMG_128 = np.full((100, 100), 128, dtype=np.uint8)
+    IMG_130 = np.full((100, 100), 130, dtype=np.uint8)
+    IMG_ONES_200 = np.ones((200, 200), dtype=np.uint8)
+    NOISE_64 = np.random.default_rng(0).integers(0, 256, (64, 64), dtype=np.uint8)
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up a temporary output folder shared by all tests."""
+        # The metric tests work on in-memory arrays; only the tests that write
+        # result files use this folder, each with its own file names.
+        cls.temp_dir = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
         """Clean up after tests."""
         import shutil
-        shutil.rmtree(self.temp_dir)
+        shutil.rmtree(cls.temp_dir)
 
-    def test_mean_squared_error_identical_images(self):
-        """Test MSE with identical images."""
-        image = np.ones((100, 100), dtype=np.uint8) * 128
-        mse = mean_squared_error(image, image)
-        self.assertEqual(mse, 0.0, "MSE should be 0 for identical images")
-
-    def test_mean_squared_error_different_images(self):
-        """Test MSE with different images."""
-        image1 = np.ones((100, 100), dtype=np.uint8) * 128
-        image2 = np.ones((100, 100), dtype=np.uint8) * 130
-        mse = mean_squared_error(image1, image2)
-        self.assertGreater(mse, 0.0, "MSE should be greater than 0 for different images")
+    def test_mean_squared_error_values(self):
+        """Test MSE on identical, equal-content and different images."""
+        cases = [
+            ("identical", self.IMG_128, self.IMG_128, 0.0),
+            ("equal copy", self.IMG_128, self.IMG_128.copy(), 0.0),
+            ("different", self.IMG_128, self.IMG_130, 4.0),
+            ("float input", self.IMG_128.astype(np.float32), self.IMG_130.astype(np.float32), 4.0),
+            ("small", np.full((10, 10), 100, dtype=np.uint8), np.full((10, 10), 110, dtype=np.uint8), 100.0),
+            ("color", np.dstack([self.IMG_128] * 3), np.dstack([self.IMG_130] * 3), 12.0),
+        ]
+        for name, image1, image2, expected in cases:
+            with self.subTest(name):
+                mse = mean_squared_error(image1, image2)
+                self.assertIsInstance(mse, float)
+                self.assertAlmostEqual(mse, expected, places=5)
 
     def test_mean_squared_error_different_sizes(self):
         """Test MSE raises error for different sized images."""
-        image1 = np.ones((100, 100), dtype=np.uint8)
-        image2 = np.ones((200, 200), dtype=np.uint8)
-        # Note: This will raise an error, but the function doesn't check for it
-        # We could add validation to the function
         with self.assertRaises((ValueError, IndexError)):
-            mean_squared_error(image1, image2)
-
-    def test_mean_squared_error_float_conversion(self):
-        """Test MSE handles float conversion correctly."""
-        image1 = np.ones((10, 10), dtype=np.uint8) * 100
-        image2 = np.ones((10, 10), dtype=np.uint8) * 110
-        mse = mean_squared_error(image1, image2)
-        self.assertIsInstance(mse, float)
-        self.assertGreater(mse, 0)
+            mean_squared_error(self.IMG_128, self.IMG_ONES_200)
+
+    def test_structural_similarity_identical_images(self):
+        """Test SSIM is 1.0 for identical images."""
+        self.assertAlmostEqual(structural_similarity(self.NOISE_64, self.NOISE_64), 1.0, places=6)
+
+    def test_structural_similarity_different_images(self):
+        """Test SSIM drops below 1.0 for different images."""
+        blurred = cv2.GaussianBlur(self.NOISE_64, (5, 5), 0)
+        ssim_value = structural_similarity(self.NOISE_64, blurred)
+        self.assertIsInstance(ssim_value, float)
+        self.assertLess(ssim_value, 1.0)
+
+    def test_structural_similarity_different_sizes(self):
+        """Test SSIM raises error for different sized images."""
+        with self.assertRaises(ValueError):
+            structural_similarity(self.IMG_128, self.IMG_ONES_200)
+
+    def test_downsample_for_ssim(self):
+        """Test SSIM downsampling by F = round(min(H, W) / 256)."""
+        small = np.zeros((300, 400), dtype=np.uint8)
+        self.assertIs(downsample_for_ssim(small), small)
+        hd = np.zeros((1080, 1920), dtype=np.uint8)
+        self.assertEqual(downsample_for_ssim(hd).shape, (270, 480))
+
+    def test_process_frame_identical_images(self):
+        """Test identical frames give MSE 0, SSIM 1 and blank diff/alpha images."""
+        compare = RenderCompare()
+        image_path = os.path.join(self.temp_dir, 'frame.png')
+        cv2.imwrite(image_path, np.random.default_rng(0).integers(0, 256, (40, 60), dtype=np.uint8))
+        result = compare._process_frame(0, image_path, image_path, 7, self.temp_dir, self.temp_dir)
+        self.assertEqual(result, (0, 0.0, 1.0))
+        alpha = cv2.imread(os.path.join(self.temp_dir, '0007.png'), cv2.IMREAD_UNCHANGED)
+        self.assertEqual(alpha.shape, (40, 60, 4))
+        self.assertFalse(alpha.any())
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, '0007.jpg')))
+
+    def test_write_to_xml_file(self):
+        """Test the XML report contains metadata and one entry per frame."""
+        compare = RenderCompare()
+        path_list = ['orig', 'test', self.temp_dir, 'diff', 'alpha']
+        compare.write_to_xml_file(
+            self.temp_dir, [[0.0, 1.5], [1.0, 0.9]], '0100', '0101',
+            path_list, 'E1', 'vA', 'vB', sport_type='NFL'
+        )
+        root = ET.parse(os.path.join(self.temp_dir, 'compareResult.xml')).getroot()
+        self.assertEqual(root.findtext('sourcePath'), 'orig')
+        self.assertEqual(root.findtext('sportType'), 'NFL')
+        self.assertEqual(root.findtext('minVal'), '0.9')
+        frames = root.findall('frames/frame')
+        self.assertEqual(
+            [(f.findtext('frameIndex'), f.findtext('value')) for f in frames],
+            [('100', '1.0'), ('101', '0.9')]
+        )
 
 
 if __name__ == '__main__':